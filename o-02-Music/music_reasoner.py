@@ -14,12 +14,36 @@ import logging
 import json
 import re
 import ast
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Dict, List, Set, Tuple, Optional, Any, Union
+from typing import DefaultDict, Dict, FrozenSet, List, Set, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, Counter
+from itertools import combinations
 from pathlib import Path
 
+try:
+    import scipy.sparse as sp
+    SCIPY_AVAILABLE = True
+except ImportError:
+    # Rules fall back to pure-Python pairwise loops without scipy
+    SCIPY_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     filename='./music_reasoner.log',
@@ -28,18 +52,92 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prerequisites of each reasoning rule. apply_reasoning_rules runs the rules in
+# layers: a rule starts once all of its prerequisites have finished, and rules
+# in the same layer read and write disjoint entity fields, so they run concurrently.
+RULE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    '_rule_01_collaboration_detection': (),
+    '_rule_07_contribution_inference': (),
+    '_rule_02_genre_inheritance': (),
+    '_rule_03_label_success_inference': (),
+    '_rule_04_artist_establishment': (),
+    '_rule_11_genre_similarity': (),
+    '_rule_12_contemporary_artists': (),
+    '_rule_06_genre_based_influence': ('_rule_01_collaboration_detection',),
+    '_rule_05_transitivity_influence': ('_rule_06_genre_based_influence',),
+    '_rule_08_collaboration_strength': ('_rule_01_collaboration_detection',),
+    '_rule_09_popularity_score': ('_rule_01_collaboration_detection',
+                                  '_rule_04_artist_establishment'),
+    '_rule_10_label_success_rating': ('_rule_09_popularity_score',),
+}
+
+
+def _fuse_rules(dependencies: Dict[str, Tuple[str, ...]], replaced: Tuple[str, ...],
+                fused_rule: str, prerequisites: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Return a copy of a rule plan with the replaced rules swapped for one fused rule."""
+    fused = {rule_name: rule_prerequisites for rule_name, rule_prerequisites in dependencies.items()
+             if rule_name not in replaced}
+    fused[fused_rule] = prerequisites
+    return fused
+
+
+# Without numba, rules 03, 04, 08, 09 and 10 run as one pass over artists and labels
+FUSED_RULE_DEPENDENCIES = _fuse_rules(
+    RULE_DEPENDENCIES,
+    ('_rule_03_label_success_inference', '_rule_04_artist_establishment',
+     '_rule_08_collaboration_strength', '_rule_09_popularity_score',
+     '_rule_10_label_success_rating'),
+    '_rules_03_04_08_09_10_fused', ('_rule_01_collaboration_detection',))
+
+# With numba, the numeric rules 03, 04, 09 and 10 run as one compiled kernel
+COMPILED_RULE_DEPENDENCIES = _fuse_rules(
+    RULE_DEPENDENCIES,
+    ('_rule_03_label_success_inference', '_rule_04_artist_establishment',
+     '_rule_09_popularity_score', '_rule_10_label_success_rating'),
+    '_rules_03_04_09_10_compiled', ('_rule_01_collaboration_detection',))
+
+if NUMBA_AVAILABLE:
+    # Serial on purpose: the kernel is launched from a rule worker thread, where
+    # numba's parallel backends (TBB in particular) can hang at interpreter exit
+    @njit(cache=True)
+    def _compute_artist_label_metrics(award_count, album_count, collab_degree,
+                                      signed_indptr, signed_indices,
+                                      out_established, out_popularity,
+                                      out_rating, out_award_winners):
+        """
+        Fused kernel for rules 03, 04, 09 and 10 over SoA artist/label arrays.
+        Labels index their signed artists through (signed_indptr, signed_indices).
+        """
+        for artist in range(award_count.shape[0]):
+            out_established[artist] = album_count[artist] >= 2 and award_count[artist] >= 1
+            out_popularity[artist] = award_count[artist] * 5 + collab_degree[artist] * 2
+
+        for label in range(signed_indptr.shape[0] - 1):
+            start = signed_indptr[label]
+            end = signed_indptr[label + 1]
+            total = 0
+            award_winners = 0
+            for pos in range(start, end):
+                artist = signed_indices[pos]
+                total += out_popularity[artist]
+                if award_count[artist] > 0:
+                    award_winners += 1
+            out_rating[label] = total // (end - start) if end > start else 0
+            out_award_winners[label] = award_winners
+
 
 def normalize_id(value: Any) -> str:
     """
     Normalize ID values to prevent foreign key mismatches.
     Converts various numeric representations to consistent string format.
+    IDs are interned so every reference to an entity shares one string object.
     """
     try:
         if pd.isna(value):
             return ""
-        return str(int(float(value)))
+        return sys.intern(str(int(float(value))))
     except (ValueError, TypeError):
-        return str(value).strip()
+        return sys.intern(str(value).strip())
 
 
 def safe_int(value: Any, default: int = 0) -> int:
@@ -114,6 +212,21 @@ def parse_id_list(value: Any) -> Set[str]:
         logger.warning(f"Failed to parse ID list '{value}': {e}")
         return set()
 
+
+def _segment_sums(values: np.ndarray, positions: List[int], offsets: List[int]) -> List[int]:
+    """
+    Sum values[positions] over the segments starting at each offset, using
+    np.add.reduceat. Empty segments sum to 0.
+    """
+    if not offsets:
+        return []
+    # The trailing 0 keeps an offset at the very end in range for reduceat
+    gathered = np.append(values.take(np.asarray(positions, dtype=np.int64)), 0)
+    sums = np.add.reduceat(gathered, offsets)
+    # reduceat yields the element at the offset for an empty segment
+    sums[np.diff(offsets, append=len(positions)) == 0] = 0
+    return sums.tolist()
+
 #  ENTITY DATA MODELS
 
 
@@ -129,10 +242,11 @@ class Song:
     release_date: Optional[date] = None
 
     # DIRECT RELATIONSHIPS (loaded from embedded lists in songs CSV)
-    artist_ids: Set[str] = field(default_factory=set)  # from artistIDs column
-    album_ids: Set[str] = field(default_factory=set)   # from albumIDs column
-    genre_ids: Set[str] = field(default_factory=set)   # from genreIDs column
-    award_ids: Set[str] = field(default_factory=set)   # from awardIDs column
+    # Immutable after loading, so stored as frozensets
+    artist_ids: FrozenSet[str] = frozenset()  # from artistIDs column
+    album_ids: FrozenSet[str] = frozenset()   # from albumIDs column
+    genre_ids: FrozenSet[str] = frozenset()   # from genreIDs column
+    award_ids: FrozenSet[str] = frozenset()   # from awardIDs column
 
     # COMPUTED PROPERTIES (populated by reasoning rules)
     is_collaborative: bool = False
@@ -344,11 +458,22 @@ class MusicReasonerEngine:
         self.collaborative_songs: Set[str] = set()
         self.successful_labels: Set[str] = set()
         self.established_artists: Set[str] = set()
-        self.collaboration_network: Dict[str,
-                                         Dict[str, int]] = defaultdict(dict)
+        self.collaboration_network: DefaultDict[str, DefaultDict[str, int]] = \
+            defaultdict(lambda: defaultdict(int))
         self.influence_network: Dict[str, Set[str]] = defaultdict(set)
         self.genre_similarity_map: Dict[str, Set[str]] = defaultdict(set)
 
+        # Integer indexing of artists for matrix-based rules
+        self._artist_ids: List[str] = []
+        self._artist_idx: Dict[str, int] = {}
+        self._collab_csr = None  # artist x artist collaboration counts (scipy)
+
+        # CSR neighbor table of the collaboration network, keyed by artist index
+        self._collab_indptr = np.zeros(1, dtype=np.int64)
+        self._collab_indices = np.zeros(0, dtype=np.int32)
+        self._collab_weights = np.zeros(0, dtype=np.int32)
+        self._collab_degree = np.zeros(0, dtype=np.int32)
+
         # Processing statistics
         self.stats = {
             'entities_loaded': 0,
@@ -364,6 +489,27 @@ class MusicReasonerEngine:
         # Cardinality violation tracking
         self.cardinality_violations: List[str] = []
 
+        # Bumped on every data load so consumers can tell when entities changed
+        self.data_version = 0
+        # Bumped after every reasoning run, which updates the computed properties
+        self.reasoning_version = 0
+
+        # Guards stats updates from rules running concurrently
+        self._stats_lock = threading.Lock()
+
+        # Per-entity aggregates derived once after loading (frozen after load)
+        self._artist_genre_set: Dict[str, frozenset] = {}
+        self._artist_decade_set: Dict[str, frozenset] = {}
+        self._artist_album_count = np.zeros(0, dtype=np.int64)
+        self._artist_award_count = np.zeros(0, dtype=np.int64)
+        # album → (genre positions, song counts) over the flat song → genre index
+        self._album_genre_histogram: Dict[str,
+                                          Tuple[np.ndarray, np.ndarray]] = {}
+        self._genre_ids: List[str] = []
+        self._genre_idx: Dict[str, int] = {}
+        self._song_genre_flat = np.zeros(0, dtype=np.int32)
+        self._song_genre_indptr = np.zeros(1, dtype=np.int64)
+
     def load_csv_data(self, data_dir: str) -> None:
         """
         Load music industry data from CSV files based on actual structure:
@@ -374,6 +520,7 @@ class MusicReasonerEngine:
         3. PHASE 1: Establish all inverse relationships from songs
         4. PHASE 2: Compute all derived relationships
         5. Validate cardinality constraints
+        6. Build derivation caches used by the reasoning rules
 
         Expected CSV structure:
         - songs.csv: Central hub with embedded lists (artistIDs, albumIDs, genreIDs, awardIDs)
@@ -404,6 +551,10 @@ class MusicReasonerEngine:
             # Phase 6: Generate comprehensive diagnostics
             self._generate_loading_diagnostics()
 
+            # Phase 7: Cache per-entity aggregates the rules re-derive
+            self._build_derivation_caches()
+            self.data_version += 1
+
             logger.info(
                 f"Successfully loaded {self.stats['entities_loaded']} entities")
             logger.info(
@@ -514,7 +665,7 @@ class MusicReasonerEngine:
                 if 'genreIDs' in row and pd.notna(row['genreIDs']):
                     album.genre_ids = parse_id_list(row['genreIDs'])
                     self.stats['relationships_parsed'] += len(album.genre_ids)
-                    logger.debug(f"Album {album_id} genres: {album.genre_ids}")
+                    logger.debug("Album %s genres: %s", album_id, album.genre_ids)
 
                 self.albums[album_id] = album
                 self.stats['entities_loaded'] += 1
@@ -670,30 +821,30 @@ class MusicReasonerEngine:
                 # These are the DIRECT relationships that will drive all inverse/derived relationships
 
                 if 'artistIDs' in row and pd.notna(row['artistIDs']):
-                    song.artist_ids = parse_id_list(row['artistIDs'])
+                    song.artist_ids = frozenset(parse_id_list(row['artistIDs']))
                     self.stats['relationships_parsed'] += len(song.artist_ids)
-                    logger.debug(f"Song {song_id} artists: {song.artist_ids}")
+                    logger.debug("Song %s artists: %s", song_id, song.artist_ids)
 
                 if 'genreIDs' in row and pd.notna(row['genreIDs']):
-                    song.genre_ids = parse_id_list(row['genreIDs'])
+                    song.genre_ids = frozenset(parse_id_list(row['genreIDs']))
                     self.stats['relationships_parsed'] += len(song.genre_ids)
-                    logger.debug(f"Song {song_id} genres: {song.genre_ids}")
+                    logger.debug("Song %s genres: %s", song_id, song.genre_ids)
 
                 if 'albumIDs' in row and pd.notna(row['albumIDs']):
-                    song.album_ids = parse_id_list(row['albumIDs'])
+                    song.album_ids = frozenset(parse_id_list(row['albumIDs']))
                     self.stats['relationships_parsed'] += len(song.album_ids)
-                    logger.debug(f"Song {song_id} albums: {song.album_ids}")
+                    logger.debug("Song %s albums: %s", song_id, song.album_ids)
                     if not song.album_ids:
                         logger.warning(
                             f"Song {song_id} has albumIDs column but parsed to empty set: '{row['albumIDs']}'")
                 else:
                     logger.debug(
-                        f"Song {song_id} has no albumIDs or albumIDs is NaN")
+                        "Song %s has no albumIDs or albumIDs is NaN", song_id)
 
                 if 'awardIDs' in row and pd.notna(row['awardIDs']):
-                    song.award_ids = parse_id_list(row['awardIDs'])
+                    song.award_ids = frozenset(parse_id_list(row['awardIDs']))
                     self.stats['relationships_parsed'] += len(song.award_ids)
-                    logger.debug(f"Song {song_id} awards: {song.award_ids}")
+                    logger.debug("Song %s awards: %s", song_id, song.award_ids)
 
                 self.songs[song_id] = song
                 self.stats['entities_loaded'] += 1
@@ -899,6 +1050,9 @@ class MusicReasonerEngine:
             f"PHASE 2 COMPLETE: Computed {derived_count} derived relationships")
 
         # Diagnostic logging for relationship chain verification
+        # (full entity scans, so only when INFO is enabled)
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info("Relationship chain diagnostics:")
         logger.info(
             f"  Albums with songs: {sum(1 for a in self.albums.values() if a.song_ids)}/{len(self.albums)}")
@@ -909,6 +1063,80 @@ class MusicReasonerEngine:
         logger.info(
             f"  Artists with albums: {sum(1 for a in self.artists.values() if a.released_album_ids)}/{len(self.artists)}")
 
+    def _build_derivation_caches(self) -> None:
+        """
+        Cache per-entity aggregates that never change after loading:
+        - artist → genres of performed songs (rule 06)
+        - artist → decades of released albums (rule 12)
+        - song → genre flat index and album → genre histogram of its songs (rule 02)
+        - album.total_duration, summed from its songs' durations
+        - artist index → album and award counts (rules 04, 09)
+
+        There is no data-mutation API after load_csv_data, so the caches are
+        frozen and never invalidated; rebuild them if entities are changed.
+        """
+        logger.info("Building derivation caches...")
+
+        self._build_artist_index()
+        artists = [self.artists[artist_id] for artist_id in self._artist_ids]
+        self._artist_album_count = np.fromiter(
+            (len(artist.released_album_ids) for artist in artists),
+            dtype=np.int64, count=len(artists))
+        self._artist_award_count = np.fromiter(
+            (len(artist.won_award_ids) for artist in artists),
+            dtype=np.int64, count=len(artists))
+
+        self._artist_genre_set = {}
+        self._artist_decade_set = {}
+        for artist in self.artists.values():
+            self._artist_genre_set[artist.id] = frozenset().union(
+                *(self.songs[song_id].genre_ids for song_id in artist.performed_song_ids
+                  if song_id in self.songs))
+            self._artist_decade_set[artist.id] = frozenset(
+                self.albums[album_id].release_year // 10
+                for album_id in artist.released_album_ids
+                if album_id in self.albums and self.albums[album_id].release_year > 0)
+
+        # Flat song → genre index (CSR layout) over every referenced genre id
+        self._genre_ids = list(self.genres.keys())
+        self._genre_idx = {genre_id: idx for idx,
+                           genre_id in enumerate(self._genre_ids)}
+        song_positions = {}
+        flat, indptr = [], [0]
+        for song_pos, song in enumerate(self.songs.values()):
+            song_positions[song.id] = song_pos
+            for genre_id in song.genre_ids:
+                if genre_id not in self._genre_idx:
+                    self._genre_idx[genre_id] = len(self._genre_ids)
+                    self._genre_ids.append(genre_id)
+                flat.append(self._genre_idx[genre_id])
+            indptr.append(len(flat))
+        self._song_genre_flat = np.array(flat, dtype=np.int32)
+        self._song_genre_indptr = np.array(indptr, dtype=np.int64)
+
+        self._album_genre_histogram = {}
+        track_positions, track_offsets = [], []
+        for album in self.albums.values():
+            album_positions = [song_positions[song_id] for song_id in album.song_ids
+                               if song_id in song_positions]
+            track_offsets.append(len(track_positions))
+            track_positions.extend(album_positions)
+            album_genres = [self._song_genre_flat[indptr[song_pos]:indptr[song_pos + 1]]
+                            for song_pos in album_positions]
+            if album_genres:
+                self._album_genre_histogram[album.id] = np.unique(
+                    np.concatenate(album_genres), return_counts=True)
+            else:
+                self._album_genre_histogram[album.id] = (
+                    np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int64))
+
+        # Album running times as one segment sum over the song durations
+        song_durations = np.fromiter((song.duration for song in self.songs.values()),
+                                     dtype=np.int64, count=len(self.songs))
+        for album, total_duration in zip(self.albums.values(),
+                                         _segment_sums(song_durations, track_positions, track_offsets)):
+            album.total_duration = total_duration
+
     def _validate_all_cardinality_constraints(self) -> None:
         """Validate cardinality constraints for all entities."""
         logger.info("Validating cardinality constraints...")
@@ -948,6 +1176,9 @@ class MusicReasonerEngine:
 
     def _generate_loading_diagnostics(self) -> None:
         """Generate comprehensive diagnostics about the loading process."""
+        # Diagnostics are log-only: skip the entity scans when INFO is off
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info("Generating loading diagnostics...")
 
         # Count entities with relationships
@@ -1007,9 +1238,16 @@ class MusicReasonerEngine:
             logger.info(
                 f"Sample album {sample_album.id}: {len(sample_album.song_ids)} songs, {len(sample_album.artist_ids)} artists")
 
-    def apply_reasoning_rules(self) -> None:
+    def apply_reasoning_rules(self, max_workers: Optional[int] = None,
+                              dependencies: Optional[Dict[str, Tuple[str, ...]]] = None) -> None:
         """
         Apply all N3 reasoning rules in logical sequence with proper dependency management.
+
+        Rules are grouped into dependency layers and the rules of each layer run
+        concurrently on a thread pool of max_workers threads (defaults to the CPU
+        count). The rule plan defaults to COMPILED_RULE_DEPENDENCIES when numba
+        is installed and FUSED_RULE_DEPENDENCIES otherwise; pass
+        RULE_DEPENDENCIES to run every rule individually.
         """
         start_time = datetime.now()
         logger.info("Starting reasoning rule application...")
@@ -1021,35 +1259,23 @@ class MusicReasonerEngine:
                     "Insufficient data for reasoning. Aborting rule application.")
                 return
 
-            # Category 1: Basic classification and detection rules
-            logger.info("Applying Category 1: Basic classification rules...")
-            self._rule_01_collaboration_detection()
-            self._rule_07_contribution_inference()
-
-            # Category 2: Inheritance and propagation rules
-            logger.info("Applying Category 2: Inheritance rules...")
-            self._rule_02_genre_inheritance()
-
-            # Category 3: Success and classification rules
-            logger.info("Applying Category 3: Success classification rules...")
-            self._rule_03_label_success_inference()
-            self._rule_04_artist_establishment()
+            # Entities populated without load_csv_data still need the caches
+            if len(self._artist_ids) != len(self.artists):
+                self._build_derivation_caches()
 
-            # Category 4: Network and influence rules
-            logger.info("Applying Category 4: Network analysis rules...")
-            self._rule_06_genre_based_influence()
-            self._rule_05_transitivity_influence()
+            if dependencies is None:
+                dependencies = COMPILED_RULE_DEPENDENCIES if NUMBA_AVAILABLE else FUSED_RULE_DEPENDENCIES
+            with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                for layer_number, layer in enumerate(self._rule_layers(dependencies), start=1):
+                    logger.info(
+                        f"Applying rule layer {layer_number}: {', '.join(layer)}")
+                    futures = [executor.submit(getattr(self, rule_name))
+                               for rule_name in layer]
+                    # Surface the first rule failure before starting the next layer
+                    for future in futures:
+                        future.result()
 
-            # Category 5: Quantitative analysis rules
-            logger.info("Applying Category 5: Quantitative analysis rules...")
-            self._rule_08_collaboration_strength()
-            self._rule_09_popularity_score()
-            self._rule_10_label_success_rating()
-
-            # Category 6: String and temporal analysis
-            logger.info("Applying Category 6: Analysis rules...")
-            self._rule_11_genre_similarity()
-            self._rule_12_contemporary_artists()
+            self.reasoning_version += 1
 
             # Update statistics
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -1064,6 +1290,29 @@ class MusicReasonerEngine:
             logger.error(f"Error during reasoning: {e}")
             raise
 
+    @staticmethod
+    def _rule_layers(dependencies: Dict[str, Tuple[str, ...]]) -> List[List[str]]:
+        """Group rules into layers whose prerequisites all lie in earlier layers."""
+        remaining = dict(dependencies)
+        completed: Set[str] = set()
+        layers = []
+        while remaining:
+            layer = [rule_name for rule_name, prerequisites in remaining.items()
+                     if completed.issuperset(prerequisites)]
+            if not layer:
+                raise ValueError(
+                    f"Circular rule dependencies among: {sorted(remaining)}")
+            for rule_name in layer:
+                del remaining[rule_name]
+            completed.update(layer)
+            layers.append(layer)
+        return layers
+
+    def _record_inferences(self, count: int) -> None:
+        """Add to the inference counter (safe across concurrently running rules)."""
+        with self._stats_lock:
+            self.stats['inferences_made'] += count
+
     def _validate_minimum_data(self) -> bool:
         """Validate that we have minimum data required for reasoning."""
         if len(self.songs) == 0:
@@ -1074,18 +1323,25 @@ class MusicReasonerEngine:
             logger.error("No artists loaded - cannot perform reasoning")
             return False
 
-        # Check if songs have artists
-        songs_with_artists = sum(
-            1 for song in self.songs.values() if song.artist_ids)
-        if songs_with_artists == 0:
+        # Check if songs have artists (stops at the first one found)
+        if not any(song.artist_ids for song in self.songs.values()):
             logger.error(
                 "No songs have associated artists - check artistIDs column parsing")
             return False
 
-        logger.info(
-            f"Data validation passed: {len(self.songs)} songs, {len(self.artists)} artists, {songs_with_artists} songs with artists")
+        if logger.isEnabledFor(logging.INFO):
+            songs_with_artists = sum(
+                1 for song in self.songs.values() if song.artist_ids)
+            logger.info(
+                f"Data validation passed: {len(self.songs)} songs, {len(self.artists)} artists, {songs_with_artists} songs with artists")
         return True
 
+    def _build_artist_index(self) -> None:
+        """Assign each artist a contiguous integer index for matrix-based rules."""
+        self._artist_ids = list(self.artists.keys())
+        self._artist_idx = {artist_id: idx for idx,
+                            artist_id in enumerate(self._artist_ids)}
+
     #  N3 REASONING RULES
 
     def _rule_01_collaboration_detection(self) -> None:
@@ -1095,51 +1351,116 @@ class MusicReasonerEngine:
         This creates implicit collaboration relationships and identifies collaborative songs.
         """
         logger.info("Applying Rule 01: Collaboration Detection")
-        collaborations_found = 0
 
-        for song in self.songs.values():
-            if len(song.artist_ids) > 1:
-                # Mark song as collaborative
-                song.is_collaborative = True
-                song.collaboration_count = len(song.artist_ids)
-                self.collaborative_songs.add(song.id)
-
-                # Create collaboration relationships between all artist pairs
-                artist_list = list(song.artist_ids)
-                for i in range(len(artist_list)):
-                    for j in range(i + 1, len(artist_list)):
-                        artist1_id = artist_list[i]
-                        artist2_id = artist_list[j]
-
-                        if artist1_id in self.artists and artist2_id in self.artists:
-                            # Add bidirectional collaboration
-                            self.artists[artist1_id].collaboration_partners.add(
-                                artist2_id)
-                            self.artists[artist2_id].collaboration_partners.add(
-                                artist1_id)
-
-                            # Initialize collaboration network
-                            if artist1_id not in self.collaboration_network:
-                                self.collaboration_network[artist1_id] = {}
-                            if artist2_id not in self.collaboration_network:
-                                self.collaboration_network[artist2_id] = {}
-
-                            # Count collaborations
-                            self.collaboration_network[artist1_id][artist2_id] = \
-                                self.collaboration_network[artist1_id].get(
-                                    artist2_id, 0) + 1
-                            self.collaboration_network[artist2_id][artist1_id] = \
-                                self.collaboration_network[artist2_id].get(
-                                    artist1_id, 0) + 1
-
-                            collaborations_found += 1
-
-        self.stats['inferences_made'] += collaborations_found
+        songs = list(self.songs.values())
+        artist_counts = np.fromiter((len(song.artist_ids) for song in songs),
+                                    dtype=np.int64, count=len(songs))
+        collaborative_positions = np.flatnonzero(artist_counts > 1)
+
+        # Mark songs as collaborative
+        for song_pos in collaborative_positions.tolist():
+            song = songs[song_pos]
+            song.is_collaborative = True
+            song.collaboration_count = int(artist_counts[song_pos])
+            self.collaborative_songs.add(song.id)
+
+        collaborative = [songs[song_pos]
+                         for song_pos in collaborative_positions.tolist()]
+        if SCIPY_AVAILABLE:
+            collaborations_found = self._count_collaborations_sparse(
+                collaborative)
+        else:
+            collaborations_found = self._count_collaborations_pairwise(
+                collaborative)
+        self._build_collaboration_table()
+
+        self._record_inferences(collaborations_found)
         logger.info(
             f"Found {collaborations_found} collaboration relationships")
         logger.info(
             f"Identified {len(self.collaborative_songs)} collaborative songs")
 
+    def _count_collaborations_sparse(self, songs: List[Song]) -> int:
+        """
+        Count collaborations as the off-diagonal entries of C = A @ A.T, where A
+        is the (artists x songs) incidence matrix of the collaborative songs.
+        Returns the number of (song, artist pair) collaborations found.
+        """
+        rows, cols = [], []
+        for song_pos, song in enumerate(songs):
+            for artist_id in song.artist_ids:
+                artist_idx = self._artist_idx.get(artist_id)
+                if artist_idx is not None:
+                    rows.append(artist_idx)
+                    cols.append(song_pos)
+
+        artist_total = len(self._artist_ids)
+        incidence = sp.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(artist_total, len(songs)))
+        # Diagonal holds each artist's own song count, not a collaboration
+        self._collab_csr = self._without_diagonal(incidence @ incidence.T)
+
+        collab = self._collab_csr.tocoo()
+        for row, col, count in zip(collab.row.tolist(), collab.col.tolist(),
+                                   collab.data.tolist()):
+            artist1_id = self._artist_ids[row]
+            artist2_id = self._artist_ids[col]
+            self.artists[artist1_id].collaboration_partners.add(artist2_id)
+            self.collaboration_network[artist1_id][artist2_id] = count
+
+        # Each unordered pair appears twice in the symmetric matrix
+        return int(self._collab_csr.sum()) // 2
+
+    def _build_collaboration_table(self) -> None:
+        """
+        Flatten the collaboration network into CSR arrays (indptr, indices,
+        weights) over artist indices so downstream rules can slice neighbors.
+        """
+        if self._collab_csr is not None:
+            self._collab_indptr = self._collab_csr.indptr.astype(np.int64)
+            self._collab_indices = self._collab_csr.indices.astype(np.int32)
+            self._collab_weights = self._collab_csr.data.astype(np.int32)
+        else:
+            indptr, indices, weights = [0], [], []
+            for artist_id in self._artist_ids:
+                for partner_id, strength in self.collaboration_network.get(artist_id, {}).items():
+                    indices.append(self._artist_idx[partner_id])
+                    weights.append(strength)
+                indptr.append(len(indices))
+
+            self._collab_indptr = np.array(indptr, dtype=np.int64)
+            self._collab_indices = np.array(indices, dtype=np.int32)
+            self._collab_weights = np.array(weights, dtype=np.int32)
+
+        # Number of collaboration partners per artist (graph degree)
+        self._collab_degree = np.diff(self._collab_indptr).astype(np.int32)
+
+    def _count_collaborations_pairwise(self, songs: List[Song]) -> int:
+        """
+        Pure-Python fallback for rule 01 when scipy is unavailable.
+        Returns the number of (song, artist pair) collaborations found.
+        """
+        collaborations_found = 0
+
+        for song in songs:
+            # Create collaboration relationships between all artist pairs
+            for artist1_id, artist2_id in combinations(song.artist_ids, 2):
+                if artist1_id in self.artists and artist2_id in self.artists:
+                    # Add bidirectional collaboration
+                    self.artists[artist1_id].collaboration_partners.add(
+                        artist2_id)
+                    self.artists[artist2_id].collaboration_partners.add(
+                        artist1_id)
+
+                    # Count collaborations
+                    self.collaboration_network[artist1_id][artist2_id] += 1
+                    self.collaboration_network[artist2_id][artist1_id] += 1
+
+                    collaborations_found += 1
+
+        return collaborations_found
+
     def _rule_02_genre_inheritance(self) -> None:
         """
         N3 Rule: Genre Inheritance
@@ -1153,21 +1474,17 @@ class MusicReasonerEngine:
             if not album.song_ids:
                 continue
 
-            # Count genre occurrences across album songs
-            genre_counts = Counter()
-            for song_id in album.song_ids:
-                if song_id in self.songs:
-                    song = self.songs[song_id]
-                    for genre_id in song.genre_ids:
-                        genre_counts[genre_id] += 1
+            # Genre occurrences across album songs
+            genre_positions, genre_counts = self._album_genre_histogram[album.id]
 
             # Inherit genres that appear in multiple songs (consensus rule)
             song_count = len(album.song_ids)
             # At least 2 songs or 1/3 of songs
             consensus_threshold = max(2, song_count // 3)
 
-            for genre_id, count in genre_counts.items():
-                if count >= consensus_threshold and genre_id not in album.genre_ids:
+            consensus = genre_positions[genre_counts >= consensus_threshold]
+            for genre_id in (self._genre_ids[pos] for pos in consensus.tolist()):
+                if genre_id not in album.genre_ids:
                     album.inherited_genres.add(genre_id)
                     album.genre_ids.add(genre_id)
 
@@ -1177,7 +1494,7 @@ class MusicReasonerEngine:
 
                     inheritances_made += 1
 
-        self.stats['inferences_made'] += inheritances_made
+        self._record_inferences(inheritances_made)
         logger.info(f"Made {inheritances_made} genre inheritance inferences")
 
     def _rule_03_label_success_inference(self) -> None:
@@ -1206,7 +1523,7 @@ class MusicReasonerEngine:
                 self.successful_labels.add(label.id)
                 successful_labels_found += 1
 
-        self.stats['inferences_made'] += successful_labels_found
+        self._record_inferences(successful_labels_found)
         logger.info(f"Identified {successful_labels_found} successful labels")
 
     def _rule_04_artist_establishment(self) -> None:
@@ -1216,24 +1533,26 @@ class MusicReasonerEngine:
         This models career progression and artist maturity automatically.
         """
         logger.info("Applying Rule 04: Artist Establishment")
-        established_artists_found = 0
 
-        for artist in self.artists.values():
-            # Count albums by this artist
-            album_count = len(artist.released_album_ids)
+        # Album and award counts per artist index, cached after loading
+        album_counts = self._artist_album_count
+        award_counts = self._artist_award_count
+        for artist_id, album_count, award_count in zip(
+                self._artist_ids, album_counts.tolist(), award_counts.tolist()):
+            artist = self.artists[artist_id]
             artist.album_count = album_count
-
-            # Count awards won by this artist
-            award_count = len(artist.won_award_ids)
             artist.award_count = award_count
 
-            # Artist is established if they have multiple albums AND at least one award
-            if album_count >= 2 and award_count >= 1:
-                artist.is_established = True
-                self.established_artists.add(artist.id)
-                established_artists_found += 1
+        # Artist is established if they have multiple albums AND at least one award
+        established_mask = (album_counts >= 2) & (award_counts >= 1)
+        established_idxs = np.flatnonzero(established_mask).tolist()
+        for artist_idx in established_idxs:
+            artist_id = self._artist_ids[artist_idx]
+            self.artists[artist_id].is_established = True
+            self.established_artists.add(artist_id)
+        established_artists_found = len(established_idxs)
 
-        self.stats['inferences_made'] += established_artists_found
+        self._record_inferences(established_artists_found)
         logger.info(
             f"Identified {established_artists_found} established artists")
 
@@ -1244,7 +1563,6 @@ class MusicReasonerEngine:
         This creates transitive influence chains through the collaboration network.
         """
         logger.info("Applying Rule 05: Transitivity for Influence")
-        transitive_influences = 0
 
         # Apply transitive closure on influence relationships
         all_artists = list(self.artists.keys())
@@ -1254,29 +1572,114 @@ class MusicReasonerEngine:
             if artist_id not in self.influence_network:
                 self.influence_network[artist_id] = set()
 
-        # Apply transitivity (limit iterations to prevent infinite loops)
-        max_iterations = 3
-        for iteration in range(max_iterations):
-            new_influences = 0
-
-            for artist1 in all_artists:
-                for artist2 in list(self.influence_network[artist1]):
-                    for artist3 in list(self.influence_network[artist2]):
-                        if (artist3 != artist1 and
-                                artist3 not in self.influence_network[artist1]):
-                            self.influence_network[artist1].add(artist3)
-                            self.artists[artist1].influenced_by.add(artist3)
-                            self.artists[artist3].influences.add(artist1)
-                            new_influences += 1
-                            transitive_influences += 1
-
-            if new_influences == 0:
-                break
+        # Nothing to close over when no direct influences were inferred
+        if not any(self.influence_network.values()):
+            logger.info("No direct influences - skipping transitive closure")
+            return
+
+        if SCIPY_AVAILABLE:
+            transitive_influences = self._close_influence_sparse()
+        else:
+            transitive_influences = self._close_influence_bfs(
+                all_artists)
 
-        self.stats['inferences_made'] += transitive_influences
+        self._record_inferences(transitive_influences)
         logger.info(
             f"Created {transitive_influences} transitive influence relationships")
 
+    def _close_influence_sparse(self) -> int:
+        """
+        Expand the influence network with boolean sparse products, I <- I + I @ I,
+        until no new edges appear. Each step doubles the path length covered, so
+        the full closure is reached in O(log N) products.
+        Returns the number of transitive influences added.
+        """
+        rows, cols = [], []
+        for artist_id, influencers in self.influence_network.items():
+            row = self._artist_idx.get(artist_id)
+            if row is None:
+                continue
+            for influencer_id in influencers:
+                col = self._artist_idx.get(influencer_id)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+
+        artist_total = len(self._artist_ids)
+        closure = sp.csr_matrix(
+            (np.ones(len(rows), dtype=bool), (rows, cols)),
+            shape=(artist_total, artist_total))
+
+        while True:
+            expanded = self._without_diagonal(closure + closure @ closure)
+            if expanded.nnz == closure.nnz:
+                break
+            closure = expanded
+
+        # Write back only the edges not already in the network
+        transitive_influences = 0
+        closure = closure.tocoo()
+        for row, col in zip(closure.row.tolist(), closure.col.tolist()):
+            artist1 = self._artist_ids[row]
+            artist3 = self._artist_ids[col]
+            if artist3 not in self.influence_network[artist1]:
+                self.influence_network[artist1].add(artist3)
+                self.artists[artist1].influenced_by.add(artist3)
+                self.artists[artist3].influences.add(artist1)
+                transitive_influences += 1
+
+        return transitive_influences
+
+    def _close_influence_bfs(self, all_artists: List[str]) -> int:
+        """
+        Pure-Python fallback for rule 05 when scipy is unavailable: one BFS per
+        artist over the direct influence network, O(V + E) each. A BFS that
+        reaches an artist whose closure is already known unions that closure
+        instead of expanding it again.
+        Returns the number of transitive influences added.
+        """
+        reachable: Dict[str, Set[str]] = {}
+
+        for source in all_artists:
+            if not self.influence_network[source]:
+                continue
+
+            seen: Set[str] = set()
+            queue = deque(self.influence_network[source])
+            while queue:
+                artist = queue.popleft()
+                if artist in seen:
+                    continue
+                seen.add(artist)
+                if artist in reachable:
+                    seen |= reachable[artist]
+                    continue
+                queue.extend(self.influence_network.get(artist, ()))
+
+            seen.discard(source)
+            reachable[source] = seen
+
+        # Write back only the edges not already in the network
+        transitive_influences = 0
+        for artist1, reached in reachable.items():
+            for artist3 in reached - self.influence_network[artist1]:
+                self.influence_network[artist1].add(artist3)
+                self.artists[artist1].influenced_by.add(artist3)
+                self.artists[artist3].influences.add(artist1)
+                transitive_influences += 1
+
+        return transitive_influences
+
+    @staticmethod
+    def _without_diagonal(matrix):
+        """Return a CSR copy of a square sparse matrix with its diagonal removed."""
+        coo = matrix.tocoo()
+        off_diagonal = coo.row != coo.col
+        return sp.csr_matrix(
+            (coo.data[off_diagonal],
+             (coo.row[off_diagonal], coo.col[off_diagonal])),
+            shape=coo.shape)
+
     def _rule_06_genre_based_influence(self) -> None:
         """
         N3 Rule: Genre-based Influence
@@ -1286,43 +1689,34 @@ class MusicReasonerEngine:
         logger.info("Applying Rule 06: Genre-based Influence")
         genre_influences = 0
 
-        for artist1 in self.artists.values():
-            for artist2_id in artist1.collaboration_partners:
-                if artist2_id in self.artists:
-                    artist2 = self.artists[artist2_id]
-
-                    # Find shared genres through songs
-                    artist1_genres = set()
-                    artist2_genres = set()
-
-                    # Collect genres from songs performed by each artist
-                    for song_id in artist1.performed_song_ids:
-                        if song_id in self.songs:
-                            artist1_genres.update(
-                                self.songs[song_id].genre_ids)
-
-                    for song_id in artist2.performed_song_ids:
-                        if song_id in self.songs:
-                            artist2_genres.update(
-                                self.songs[song_id].genre_ids)
-
-                    # If they share genres, they influence each other
-                    shared_genres = artist1_genres & artist2_genres
-                    if shared_genres:
-                        # Bidirectional influence
-                        if artist2.id not in artist1.influenced_by:
-                            artist1.influenced_by.add(artist2.id)
-                            artist2.influences.add(artist1.id)
-                            self.influence_network[artist1.id].add(artist2.id)
-                            genre_influences += 1
-
-                        if artist1.id not in artist2.influenced_by:
-                            artist2.influenced_by.add(artist1.id)
-                            artist1.influences.add(artist2.id)
-                            self.influence_network[artist2.id].add(artist1.id)
-                            genre_influences += 1
-
-        self.stats['inferences_made'] += genre_influences
+        # Each artist's genres (through their songs), cached after loading
+        artist_genres = self._artist_genre_set
+
+        # Unique collaboration edges (upper triangle of the CSR table)
+        rows = np.repeat(np.arange(len(self._artist_ids)), self._collab_degree)
+        upper = self._collab_indices > rows
+
+        for row, col in zip(rows[upper].tolist(), self._collab_indices[upper].tolist()):
+            artist1_id = self._artist_ids[row]
+            artist2_id = self._artist_ids[col]
+
+            # If they share genres, they influence each other
+            if artist_genres[artist1_id] & artist_genres[artist2_id]:
+                artist1 = self.artists[artist1_id]
+                artist2 = self.artists[artist2_id]
+
+                # Bidirectional influence (each edge is visited exactly once)
+                artist1.influenced_by.add(artist2_id)
+                artist2.influences.add(artist1_id)
+                self.influence_network[artist1_id].add(artist2_id)
+
+                artist2.influenced_by.add(artist1_id)
+                artist1.influences.add(artist2_id)
+                self.influence_network[artist2_id].add(artist1_id)
+
+                genre_influences += 2
+
+        self._record_inferences(genre_influences)
         logger.info(
             f"Created {genre_influences} genre-based influence relationships")
 
@@ -1347,7 +1741,7 @@ class MusicReasonerEngine:
                 album.contributors.add(album.label_id)
                 contributions_found += 1
 
-        self.stats['inferences_made'] += contributions_found
+        self._record_inferences(contributions_found)
         logger.info(
             f"Identified {contributions_found} contribution relationships")
 
@@ -1359,9 +1753,17 @@ class MusicReasonerEngine:
         """
         logger.info("Applying Rule 08: Collaboration Strength Calculation")
 
-        for artist in self.artists.values():
-            for partner_id, strength in self.collaboration_network.get(artist.id, {}).items():
-                artist.collaboration_strength[partner_id] = strength
+        indptr = self._collab_indptr.tolist()
+        indices = self._collab_indices.tolist()
+        weights = self._collab_weights.tolist()
+
+        # Only artists with at least one partner get strengths
+        for artist_idx in np.flatnonzero(self._collab_degree).tolist():
+            artist_id = self._artist_ids[artist_idx]
+            start, end = indptr[artist_idx], indptr[artist_idx + 1]
+            partner_ids = [self._artist_ids[idx] for idx in indices[start:end]]
+            self.artists[artist_id].collaboration_strength.update(
+                zip(partner_ids, weights[start:end]))
 
         logger.info("Collaboration strength calculations completed")
 
@@ -1373,12 +1775,12 @@ class MusicReasonerEngine:
         """
         logger.info("Applying Rule 09: Popularity Score Calculation")
 
-        for artist in self.artists.values():
-            collaboration_count = len(artist.collaboration_partners)
-            award_count = artist.award_count
-
-            # Weight awards more heavily than collaborations
-            popularity_score = (award_count * 5) + (collaboration_count * 2)
+        artists = [self.artists[artist_id] for artist_id in self._artist_ids]
+        # Weight awards more heavily than collaborations (collaboration count
+        # is the artist's degree in the CSR table)
+        popularity_scores = (self._artist_award_count * 5) + \
+            (self._collab_degree * 2)
+        for artist, popularity_score in zip(artists, popularity_scores.tolist()):
             artist.popularity_score = popularity_score
 
         logger.info("Popularity score calculations completed")
@@ -1391,44 +1793,255 @@ class MusicReasonerEngine:
         """
         logger.info("Applying Rule 10: Label Success Rating")
 
-        for label in self.record_labels.values():
-            total_score = 0
-            artist_count = 0
+        labels = list(self.record_labels.values())
 
+        # Label position of each artist (-1 when unsigned)
+        label_of_artist = np.full(len(self._artist_ids), -1, dtype=np.int64)
+        for label_pos, label in enumerate(labels):
             for artist_id in label.signed_artists:
-                if artist_id in self.artists:
-                    total_score += self.artists[artist_id].popularity_score
-                    artist_count += 1
-
-            # Average popularity score of signed artists
-            label.success_rating = total_score // max(
-                1, artist_count) if artist_count > 0 else 0
+                artist_idx = self._artist_idx.get(artist_id)
+                if artist_idx is not None:
+                    label_of_artist[artist_idx] = label_pos
+
+        popularity_scores = np.fromiter(
+            (self.artists[artist_id].popularity_score for artist_id in self._artist_ids),
+            dtype=np.int64, count=len(self._artist_ids))
+
+        # Segment sums of signed artists' popularity per label
+        signed = label_of_artist >= 0
+        totals = np.bincount(label_of_artist[signed], weights=popularity_scores[signed],
+                             minlength=len(labels)).astype(np.int64)
+        artist_counts = np.bincount(
+            label_of_artist[signed], minlength=len(labels))
+
+        # Average popularity score of signed artists (0 for labels with none)
+        ratings = totals // np.maximum(1, artist_counts)
+        for label, rating in zip(labels, ratings.tolist()):
+            label.success_rating = rating
 
         logger.info("Label success rating calculations completed")
 
+    def _prepare_soa(self) -> Dict[str, np.ndarray]:
+        """
+        Lay out the artist and label tables as numpy arrays (structure of arrays)
+        indexed by artist index and label position.
+        """
+        signed_indptr, signed_indices = [0], []
+        for label in self.record_labels.values():
+            signed_indices.extend(self._artist_idx[artist_id] for artist_id in label.signed_artists
+                                  if artist_id in self._artist_idx)
+            signed_indptr.append(len(signed_indices))
+
+        return {
+            'artist_award_count': self._artist_award_count,
+            'artist_album_count': self._artist_album_count,
+            'artist_collab_degree': self._collab_degree,
+            'label_signed_indptr': np.array(signed_indptr, dtype=np.int64),
+            'label_signed_indices': np.array(signed_indices, dtype=np.int64),
+        }
+
+    def _rules_03_04_09_10_compiled(self) -> None:
+        """
+        Numba-compiled equivalent of rules 03 (label success), 04 (artist
+        establishment), 09 (popularity score) and 10 (label success rating),
+        evaluated in a single fused kernel over the SoA tables.
+        """
+        logger.info(
+            "Applying Rules 03, 04, 09, 10: compiled artist/label metrics")
+
+        soa = self._prepare_soa()
+        artist_total = len(self._artist_ids)
+        labels = list(self.record_labels.values())
+
+        established = np.zeros(artist_total, dtype=np.bool_)
+        popularity = np.zeros(artist_total, dtype=np.int64)
+        ratings = np.zeros(len(labels), dtype=np.int64)
+        award_winners = np.zeros(len(labels), dtype=np.int64)
+        _compute_artist_label_metrics(
+            soa['artist_award_count'], soa['artist_album_count'],
+            soa['artist_collab_degree'], soa['label_signed_indptr'],
+            soa['label_signed_indices'], established, popularity,
+            ratings, award_winners)
+
+        # Rules 04 and 09 write-back
+        for artist_id, album_count, award_count, score in zip(
+                self._artist_ids, soa['artist_album_count'].tolist(),
+                soa['artist_award_count'].tolist(), popularity.tolist()):
+            artist = self.artists[artist_id]
+            artist.album_count = album_count
+            artist.award_count = award_count
+            artist.popularity_score = score
+
+        established_artists_found = 0
+        for artist_idx in np.flatnonzero(established).tolist():
+            artist_id = self._artist_ids[artist_idx]
+            self.artists[artist_id].is_established = True
+            self.established_artists.add(artist_id)
+            established_artists_found += 1
+
+        # Rules 03 and 10 write-back
+        successful_labels_found = 0
+        for label, rating, winners in zip(labels, ratings.tolist(), award_winners.tolist()):
+            label.success_rating = rating
+            if winners >= 2:
+                label.is_successful = True
+                label.award_winning_artists = {
+                    artist_id for artist_id in label.signed_artists
+                    if artist_id in self.artists and self.artists[artist_id].won_award_ids}
+                self.successful_labels.add(label.id)
+                successful_labels_found += 1
+
+        self._record_inferences(
+            successful_labels_found + established_artists_found)
+        logger.info(f"Identified {successful_labels_found} successful labels")
+        logger.info(
+            f"Identified {established_artists_found} established artists")
+
+    def _rules_03_04_08_09_10_fused(self) -> None:
+        """
+        Single-pass equivalent of rules 03 (label success), 04 (artist
+        establishment), 08 (collaboration strength), 09 (popularity score) and
+        10 (label success rating): one loop over artists accumulates per-label
+        totals, then one loop over labels finishes the label rules.
+        """
+        logger.info(
+            "Applying Rules 03, 04, 08, 09, 10: fused artist/label pass")
+
+        labels = list(self.record_labels.values())
+        label_of_artist = {artist_id: label.id for label in labels
+                           for artist_id in label.signed_artists}
+
+        # Scratch per-label accumulators: [popularity total, artist count]
+        label_totals: Dict[str, List[int]] = {label.id: [0, 0] for label in labels}
+        award_winners: Set[str] = set()
+
+        indptr = self._collab_indptr.tolist()
+        indices = self._collab_indices.tolist()
+        weights = self._collab_weights.tolist()
+
+        established_artists_found = 0
+        for artist_idx, (artist_id, album_count, award_count, degree) in enumerate(zip(
+                self._artist_ids, self._artist_album_count.tolist(),
+                self._artist_award_count.tolist(), self._collab_degree.tolist())):
+            artist = self.artists[artist_id]
+
+            # Rule 04: establishment
+            artist.album_count = album_count
+            artist.award_count = award_count
+            if album_count >= 2 and award_count >= 1:
+                artist.is_established = True
+                self.established_artists.add(artist_id)
+                established_artists_found += 1
+
+            # Rule 08: collaboration strength
+            if degree:
+                start, end = indptr[artist_idx], indptr[artist_idx + 1]
+                artist.collaboration_strength.update(
+                    zip([self._artist_ids[idx] for idx in indices[start:end]],
+                        weights[start:end]))
+
+            # Rule 09: popularity
+            artist.popularity_score = (award_count * 5) + (degree * 2)
+
+            if award_count > 0:
+                award_winners.add(artist_id)
+
+            # Rule 10: accumulate the artist's popularity for its label
+            label_id = label_of_artist.get(artist_id)
+            if label_id is not None:
+                totals = label_totals[label_id]
+                totals[0] += artist.popularity_score
+                totals[1] += 1
+
+        successful_labels_found = 0
+        for label in labels:
+            total_score, artist_count = label_totals[label.id]
+            label.success_rating = total_score // artist_count if artist_count > 0 else 0
+
+            # Rule 03 credits every label an artist is signed to
+            award_winning_artists = award_winners.intersection(label.signed_artists)
+            if len(award_winning_artists) >= 2:
+                label.is_successful = True
+                label.award_winning_artists = award_winning_artists
+                self.successful_labels.add(label.id)
+                successful_labels_found += 1
+
+        self._record_inferences(
+            successful_labels_found + established_artists_found)
+        logger.info(f"Identified {successful_labels_found} successful labels")
+        logger.info(
+            f"Identified {established_artists_found} established artists")
+        logger.info("Collaboration strength, popularity and label rating calculations completed")
+
     def _rule_11_genre_similarity(self) -> None:
         """
         N3 Rule: Genre Similarity Detection
         Find genres with similar names using string matching.
         This identifies related genres like "Rock" and "Folk Rock".
+        Genres with an empty name are skipped: the empty string is contained
+        in every name but says nothing about similarity.
         """
         logger.info("Applying Rule 11: Genre Similarity Detection")
-        similarities_found = 0
 
+        # Both matchers see the same non-empty names (an Aho-Corasick
+        # automaton never matches the empty pattern, `"" in name` always does)
         genre_names = {genre.id: genre.genre_name.lower()
-                       for genre in self.genres.values()}
+                       for genre in self.genres.values() if genre.genre_name}
+
+        if AHOCORASICK_AVAILABLE:
+            similar_pairs = self._find_similar_genres_automaton(genre_names)
+        else:
+            similar_pairs = self._find_similar_genres_pairwise(genre_names)
+
+        # Similarity is symmetric: record both directions of each pair
+        for genre1_id, genre2_id in similar_pairs:
+            self.genre_similarity_map[genre1_id].add(genre2_id)
+            self.genre_similarity_map[genre2_id].add(genre1_id)
+
+        for genre_id, related in self.genre_similarity_map.items():
+            self.genres[genre_id].related_genres.update(related)
 
+        similarities_found = 2 * len(similar_pairs)
+        self._record_inferences(similarities_found)
+        logger.info(f"Found {similarities_found} genre similarities")
+
+    @staticmethod
+    def _find_similar_genres_automaton(genre_names: Dict[str, str]) -> Set[Tuple[str, str]]:
+        """
+        Find genre pairs where one name contains the other with a single
+        Aho-Corasick pass over each name. Returns unordered (sorted) id pairs.
+        """
+        automaton = ahocorasick.Automaton()
+        ids_by_name = defaultdict(list)
+        for genre_id, name in genre_names.items():
+            ids_by_name[name].append(genre_id)
+        for name, genre_ids in ids_by_name.items():
+            automaton.add_word(name, genre_ids)
+        automaton.make_automaton()
+
+        similar_pairs = set()
+        for genre1_id, name1 in genre_names.items():
+            for _, contained_ids in automaton.iter(name1):
+                for genre2_id in contained_ids:
+                    if genre1_id != genre2_id:
+                        similar_pairs.add(
+                            (min(genre1_id, genre2_id), max(genre1_id, genre2_id)))
+        return similar_pairs
+
+    @staticmethod
+    def _find_similar_genres_pairwise(genre_names: Dict[str, str]) -> Set[Tuple[str, str]]:
+        """
+        Pure-Python fallback for rule 11 when pyahocorasick is unavailable.
+        Returns unordered (sorted) id pairs.
+        """
+        similar_pairs = set()
         for genre1_id, name1 in genre_names.items():
             for genre2_id, name2 in genre_names.items():
-                if genre1_id != genre2_id:
+                if genre1_id < genre2_id:
                     # Check if one name contains the other
                     if name1 in name2 or name2 in name1:
-                        self.genre_similarity_map[genre1_id].add(genre2_id)
-                        self.genres[genre1_id].related_genres.add(genre2_id)
-                        similarities_found += 1
-
-        self.stats['inferences_made'] += similarities_found
-        logger.info(f"Found {similarities_found} genre similarities")
+                        similar_pairs.add((genre1_id, genre2_id))
+        return similar_pairs
 
     def _rule_12_contemporary_artists(self) -> None:
         """
@@ -1437,33 +2050,28 @@ class MusicReasonerEngine:
         This creates temporal clusters of artists based on release patterns.
         """
         logger.info("Applying Rule 12: Contemporary Artists")
-        contemporary_pairs = 0
 
         # Group artists by decade of album releases
+        decades_of_artist = self._artist_decade_set
         artist_decades = defaultdict(set)
 
-        for album in self.albums.values():
-            if album.release_year > 0:
-                decade = album.release_year // 10
-                for artist_id in album.artist_ids:
-                    artist_decades[decade].add(artist_id)
-
-        # Create contemporary relationships within each decade
-        for decade, artist_ids in artist_decades.items():
-            artist_list = list(artist_ids)
-            for i in range(len(artist_list)):
-                for j in range(i + 1, len(artist_list)):
-                    artist1_id = artist_list[i]
-                    artist2_id = artist_list[j]
-
-                    if artist1_id in self.artists and artist2_id in self.artists:
-                        self.artists[artist1_id].contemporary_artists.add(
-                            artist2_id)
-                        self.artists[artist2_id].contemporary_artists.add(
-                            artist1_id)
-                        contemporary_pairs += 1
-
-        self.stats['inferences_made'] += contemporary_pairs
+        for artist_id, decades in decades_of_artist.items():
+            for decade in decades:
+                artist_decades[decade].add(artist_id)
+
+        # Contemporaries are the union of an artist's decade cohorts (set ops in C,
+        # no pair enumeration)
+        for artist_id, decades in decades_of_artist.items():
+            contemporaries = self.artists[artist_id].contemporary_artists
+            for decade in decades:
+                contemporaries.update(artist_decades[decade])
+            contemporaries.discard(artist_id)
+
+        # Each decade cohort of k artists contributes k choose 2 pairs
+        contemporary_pairs = sum(len(artist_ids) * (len(artist_ids) - 1) // 2
+                                 for artist_ids in artist_decades.values())
+
+        self._record_inferences(contemporary_pairs)
         logger.info(
             f"Identified {contemporary_pairs} contemporary artist relationships")
 
@@ -1600,8 +2208,9 @@ def main():
     # Get diagnostics
     diagnostics = reasoner.get_diagnostics()
     logger.info("Reasoning completed successfully")
-    logger.info(
-        f"Final diagnostics: {json.dumps(diagnostics, indent=2, default=str)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"Final diagnostics: {json.dumps(diagnostics, indent=2, default=str)}")
 
 
 if __name__ == "__main__":
@@ -6,25 +6,241 @@ Handles URI generation, datatype conversion, and comprehensive RDF validation.
 
 import json
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from datetime import datetime, date
-from typing import Dict, List, Set, Tuple, Optional, Any, Union
+from typing import Dict, Iterable, List, Set, Tuple, Optional, Any, Union
 from pathlib import Path
 from collections import defaultdict, Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 
 try:
-    from rdflib import Graph, Namespace, URIRef, Literal, BNode
+    from rdflib import Graph, Namespace, URIRef, Literal
     from rdflib.namespace import RDF, RDFS, OWL, XSD
+    from rdflib.plugins.sparql import prepareQuery
     RDFLIB_AVAILABLE = True
 except ImportError:
     print("Warning: rdflib not available. Install with: pip install rdflib")
     RDFLIB_AVAILABLE = False
 
+try:
+    # Registers the 'Oxigraph' store and the native ox-* serializers with rdflib
+    import oxrdflib  # noqa: F401
+    OXRDFLIB_AVAILABLE = True
+except ImportError:
+    OXRDFLIB_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import the core reasoner
 from music_reasoner import MusicReasonerEngine, normalize_id
 
 logger = logging.getLogger(__name__)
 
+# Data properties of the ontology: name -> (XSD range, rdfs:comment)
+DATA_PROPERTIES = {
+    'title': ('string', "The title of a song"),
+    'duration': ('int', "The duration of a song in seconds"),
+    'releaseDate': ('date', "The date when a song was released"),
+    'name': ('string', "The name of an artist"),
+    'birthDate': ('date', "The birth date of an artist"),
+    'nationality': ('string', "The nationality of an artist"),
+    'albumTitle': ('string', "The title of an album"),
+    'releaseYear': ('int', "The year when an album was released"),
+    'labelName': ('string', "The name of a record label"),
+    'location': ('string', "The location of a record label"),
+    'genreName': ('string', "The name of a genre"),
+    'description': ('string', "A description of a genre"),
+    'awardName': ('string', "The name of an award"),
+    'year': ('int', "The year an award was given"),
+    'awardingBody': ('string', "The organization that gives the award"),
+    'popularityScore': ('int', "Calculated popularity metric"),
+    'collaborationStrength': ('int', "Numeric measure of collaboration strength"),
+    'labelSuccessRating': ('int', "Success metric for record labels")
+}
+
+# Object properties of the ontology: name -> rdfs:comment
+OBJECT_PROPERTIES = {
+    'performedBy': "Relates a song to the artist(s) who perform it",
+    'featuredOn': "Relates a song to the album(s) it appears on",
+    'hasGenre': "Relates a song or album to its genre(s)",
+    'hasWonAward': "Relates a song or artist to awards they have won",
+    'signedTo': "Relates an artist to the record label they are signed to",
+    'releasedByArtist': "Relates an album to the artist(s) who released it",
+    'releasedByLabel': "Relates an album to the record label that released it",
+    'collaboratesWith': "Relates artists who have performed songs together",
+    'influencedBy': "Relates artists through genre and collaboration networks",
+    'isContributor': "Relates an entity to albums they contributed to",
+    'contemporaryOf': "Relates artists who were active in the same time period"
+}
+
+# Properties used by the entity conversion without a schema definition
+UNDECLARED_PROPERTIES = (
+    'totalDuration', 'hasInheritedGenre', 'features', 'hasSignedArtist',
+    'awardWonBy', 'hasCollaborationStrength', 'withArtist'
+)
+
+
+# Example SPARQL queries over the converted graph: name -> query text
+EXAMPLE_QUERIES = {
+    'all_collaborative_songs': """
+        PREFIX music: <http://example.org/music#>
+        SELECT ?song ?title WHERE {
+            ?song a music:CollaborativeSong ;
+                  music:title ?title .
+        }
+    """,
+    'established_artists_with_labels': """
+        PREFIX music: <http://example.org/music#>
+        SELECT ?artist ?name ?label WHERE {
+            ?artist a music:EstablishedArtist ;
+                    music:name ?name ;
+                    music:signedTo ?labelUri .
+            ?labelUri music:labelName ?label .
+        }
+    """,
+    'genre_popularity': """
+        PREFIX music: <http://example.org/music#>
+        SELECT ?genre ?genreName (COUNT(?song) AS ?songCount) WHERE {
+            ?song music:hasGenre ?genre .
+            ?genre music:genreName ?genreName .
+        }
+        GROUP BY ?genre ?genreName
+        ORDER BY DESC(?songCount)
+    """,
+    'collaboration_networks': """
+        PREFIX music: <http://example.org/music#>
+        SELECT ?artist1 ?name1 ?artist2 ?name2 WHERE {
+            ?artist1 music:collaboratesWith ?artist2 ;
+                     music:name ?name1 .
+            ?artist2 music:name ?name2 .
+            FILTER(?artist1 != ?artist2)
+        }
+    """
+}
+
+
+# Entity converters run concurrently by convert_to_rdf. Each only reads the
+# reasoner and returns the (s, p, o, graph) quads for its own subjects.
+ENTITY_CONVERTERS = (
+    '_convert_songs', '_convert_artists', '_convert_albums',
+    '_convert_record_labels', '_convert_genres', '_convert_awards',
+    '_add_reasoning_results'
+)
+
+# Identifier cleaning: ASCII non-word characters map to '_' through a translate
+# table; the regex only runs for identifiers that still contain non-ASCII text
+_IDENTIFIER_TRANS = str.maketrans(
+    {c: '_' for c in map(chr, range(128)) if not (c.isalnum() or c in '-_')})
+_NON_WORD_RE = re.compile(r'[^\w\-_]')
+_UNDERSCORE_RUN_RE = re.compile(r'_{2,}')
+
+# Basic URI syntax accepted by validation: known scheme, no whitespace
+_VALID_URI_PREFIXES = ('http://', 'https://', 'urn:')
+_URI_WHITESPACE_RE = re.compile(r'[ \t\n\r]')
+
+
+# N-Triples string escapes: backslash, quote and control characters
+_NT_ESCAPES = str.maketrans({
+    **{chr(code): f"\\u{code:04X}" for code in range(0x20)},
+    '\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t'
+})
+
+
+def _nt_escape(text: str) -> str:
+    """Escape a literal's lexical form for an N-Triples string."""
+    return text.translate(_NT_ESCAPES)
+
+
+def _nt_term(term: Union['URIRef', 'Literal']) -> str:
+    """Render a URI or literal term in N-Triples syntax."""
+    if isinstance(term, Literal):
+        if term.language:
+            return f'"{_nt_escape(term)}"@{term.language}'
+        if term.datatype:
+            return f'"{_nt_escape(term)}"^^<{term.datatype}>'
+        return f'"{_nt_escape(term)}"'
+    return f"<{term}>"
+
+
+def _fast_literal(lexical: str, value: Any, datatype: 'URIRef') -> 'Literal':
+    """
+    Build a typed Literal from its canonical lexical form and Python value,
+    skipping the lexical parsing and casting done by Literal.__new__.
+    """
+    literal = str.__new__(Literal, lexical)
+    literal._language = None
+    literal._datatype = datatype
+    literal._value = value
+    literal._ill_typed = False
+    return literal
+
+
+def _fast_literal_supported() -> bool:
+    """Check that _fast_literal matches this rdflib version's Literal."""
+    try:
+        probe = _fast_literal("42", 42, XSD.int)
+        expected = Literal(42, datatype=XSD.int)
+        return (probe == expected and hash(probe) == hash(expected)
+                and probe.toPython() == 42 and probe.n3() == expected.n3())
+    except Exception:
+        return False
+
+
+_FAST_LITERAL = RDFLIB_AVAILABLE and _fast_literal_supported()
+
+
+@lru_cache(maxsize=None)
+def _lit_str(value: str) -> 'Literal':
+    """Return the shared plain string literal for a (frequently repeated) value."""
+    return Literal(value)
+
+
+@lru_cache(maxsize=None)
+def _lit_int(value: int) -> 'Literal':
+    """Return the shared xsd:int literal for a value."""
+    if _FAST_LITERAL:
+        return _fast_literal(str(value), value, XSD.int)
+    return Literal(value, datatype=XSD.int)
+
+
+def _lit_date(value: date) -> 'Literal':
+    """Return the xsd:date literal for a date."""
+    if _FAST_LITERAL:
+        return _fast_literal(value.isoformat(), value, XSD.date)
+    return Literal(value.isoformat(), datatype=XSD.date)
+
+
+@lru_cache(maxsize=None)
+def _prepared_example_queries() -> Dict[str, Any]:
+    """Parse and compile the example queries once per process."""
+    return {name: prepareQuery(query) for name, query in EXAMPLE_QUERIES.items()}
+
+
+@dataclass
+class GraphScan:
+    """
+    Per-term tallies of an RDF graph, gathered in a single pass and shared by
+    validation and the statistics report.
+    """
+    triple_count: int
+    subjects: Set[URIRef]           # distinct URI subjects
+    objects: Set[URIRef]            # distinct URI objects
+    uri_counts: Dict[URIRef, int]   # occurrences of each URI in any position
+    invalid_uris: Set[URIRef]
+    namespace_usage: Dict[str, int]
+    songs_n: int                    # subjects that are converted songs
+    artists_n: int
+    albums_n: int
+
 
 class RDFOntologyManager:
     """
@@ -33,83 +249,162 @@ class RDFOntologyManager:
     handles URI generation, and exports to multiple RDF formats.
     """
 
-    def __init__(self, reasoner: MusicReasonerEngine):
-        """Initialize RDF manager with reasoning engine instance."""
+    def __init__(self, reasoner: MusicReasonerEngine, store: str = 'SimpleMemory',
+                 created_at: Optional[str] = None):
+        """
+        Initialize RDF manager with reasoning engine instance.
+
+        created_at is the ISO timestamp recorded as the ontology's dcterms:created
+        value. It defaults to the time the manager is created and is kept across
+        conversions; pass a fixed value for reproducible output.
+
+        store selects the rdflib store backing the graph:
+        - 'SimpleMemory' (default): in-memory store without per-context
+          indexes, the cheapest to fill for this convert-then-serialize
+          workflow (SPARQL still works, it just has no named graphs)
+        - 'default': rdflib's context-aware in-memory store
+        - 'Oxigraph': loads and serializes large ontologies through oxigraph's
+          native code. Falls back to 'SimpleMemory' when oxrdflib is not
+          installed. Note that oxrdflib stores xsd:int values as xsd:integer.
+        """
         if not RDFLIB_AVAILABLE:
             raise ImportError(
                 "rdflib is required for RDF operations. Install with: pip install rdflib")
 
+        if store == 'Oxigraph' and not OXRDFLIB_AVAILABLE:
+            logger.warning(
+                "oxrdflib not available, using the in-memory store. Install with: pip install oxrdflib")
+            store = 'SimpleMemory'
+
         self.reasoner = reasoner
-        self.graph = Graph()
+        self.store = store
+        self.graph = Graph(store=store)
+
+        # Size of the graph as of the last conversion, the only path that fills
+        # it. len(graph) walks every triple on the in-memory stores
+        self._triple_count = 0
+
+        # Reasoner (data_version, reasoning_version) the graph was converted from
+        self._converted_state: Optional[Tuple[int, int]] = None
+
+        # Graph scan and property ranking for validation and reporting, kept
+        # until the next conversion
+        self._graph_scan: Optional[GraphScan] = None
+        self._property_usage_ranking: Optional[List[Tuple[str, int]]] = None
 
         # Define namespaces
         self.ns = Namespace("http://example.org/music#")
         self.music_ns = Namespace("http://example.org/music/")
 
+        # Predicate URIs resolved once instead of per triple
+        self._pred = {name: self.ns[name] for name in (
+            *DATA_PROPERTIES, *OBJECT_PROPERTIES, *UNDECLARED_PROPERTIES)}
+
         # Bind namespaces to graph
-        self.graph.bind("music", self.ns)
-        self.graph.bind("owl", OWL)
-        self.graph.bind("rdf", RDF)
-        self.graph.bind("rdfs", RDFS)
-        self.graph.bind("xsd", XSD)
+        self._bind_namespaces()
 
         # RDF statistics
-        self.rdf_stats = {
-            'total_triples': 0,
-            'entity_counts': defaultdict(int),
-            'property_usage': defaultdict(int),
-            'unique_subjects': set(),
-            'unique_predicates': set(),
-            'unique_objects': set()
-        }
+        self._reset_rdf_stats()
+
+        # Ontology creation timestamp, shared by every conversion
+        self._created_at = Literal(created_at or datetime.now().isoformat(),
+                                   datatype=XSD.dateTime)
+
+        # Class and property definition triples, built on first conversion
+        self._schema: Optional[List[Tuple[Any, Any, Any]]] = None
 
-        # URI cache for consistency
-        self.uri_cache = {}
+        # URI cache for consistency, valid for one reasoner data version
+        self.uri_cache: Dict[Tuple[str, str], URIRef] = {}
+        self._uri_cache_version = reasoner.data_version
+
+        # Namespace of each URI seen by a graph scan, kept with the URI cache
+        self._namespace_cache: Dict[URIRef, Optional[str]] = {}
+
+        # Expected entity URIs per prefix, for coverage metrics
+        self._entity_uri_sets: Dict[str, Set[URIRef]] = {}
+        self._entity_uris_version = reasoner.data_version
 
         logger.info("RDF Ontology Manager initialized")
 
-    def convert_to_rdf(self) -> None:
+    def convert_to_rdf(self, max_workers: Optional[int] = None, force: bool = False) -> None:
         """
         Convert all entities and reasoning results to RDF triples.
         This is the main method that orchestrates the entire conversion process.
+
+        The ENTITY_CONVERTERS build their quads concurrently on a thread pool of
+        max_workers threads (defaults to the CPU count); the quads are then
+        inserted into the graph in one bulk operation.
+
+        The conversion is skipped while the graph is up to date, i.e. the
+        reasoner has neither reloaded its data nor rerun its rules since the
+        last conversion. Pass force=True, or call invalidate() after changing
+        the reasoner entities some other way, to convert again.
         """
+        reasoner_state = (self.reasoner.data_version, self.reasoner.reasoning_version)
+        if not force and self._converted_state == reasoner_state:
+            logger.info("RDF graph is up to date, skipping conversion")
+            return
+
         logger.info("Starting RDF conversion...")
 
         try:
-            # Clear existing graph
-            self.graph = Graph()
-            self._bind_namespaces()
+            # Start from an empty graph. Replacing a populated one is far cheaper
+            # than removing its triples one by one; an empty one is reused as is
+            if (None, None, None) in self.graph:
+                self.graph = Graph(store=self.store)
+                self._bind_namespaces()
+            self._triple_count = 0
+            self._converted_state = None
+            self._graph_scan = None
+            self._property_usage_ranking = None
+            self._reset_rdf_stats()
+
+            # Drop cached URIs only when the reasoner reloaded its data
+            if self._uri_cache_version != self.reasoner.data_version:
+                self.uri_cache.clear()
+                self._namespace_cache.clear()
+                self._uri_cache_version = self.reasoner.data_version
 
             # Add ontology metadata
             self._add_ontology_metadata()
 
-            # Add class definitions
-            self._add_class_definitions()
-
-            # Add property definitions
-            self._add_property_definitions()
-
-            # Convert entities
-            self._convert_songs()
-            self._convert_artists()
-            self._convert_albums()
-            self._convert_record_labels()
-            self._convert_genres()
-            self._convert_awards()
-
-            # Add reasoning results
-            self._add_reasoning_results()
+            # Convert entities and reasoning results, then store them together
+            # with the class and property definitions
+            graph = self.graph
+            with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                futures = [executor.submit(getattr(self, converter))
+                           for converter in ENTITY_CONVERTERS]
+                self._add_quads(chain(
+                    ((s, p, o, graph) for s, p, o in self._schema_triples()),
+                    chain.from_iterable(future.result() for future in futures)))
 
             # Calculate statistics
             self._calculate_rdf_statistics()
+            self._triple_count = self.rdf_stats['total_triples']
+            self._converted_state = reasoner_state
 
             logger.info(
-                f"RDF conversion completed. Generated {len(self.graph)} triples.")
+                f"RDF conversion completed. Generated {self._triple_count} triples.")
 
         except Exception as e:
             logger.error(f"Error during RDF conversion: {e}")
             raise
 
+    def invalidate(self) -> None:
+        """Mark the graph as out of date so the next convert_to_rdf() rebuilds it."""
+        self._converted_state = None
+
+    def _reset_rdf_stats(self) -> None:
+        """Start a fresh set of RDF statistics for the next conversion."""
+        self.rdf_stats = {
+            'total_triples': 0,
+            'entity_counts': defaultdict(int),
+            'property_usage': defaultdict(int),
+            'unique_subjects': 0,
+            'unique_predicates': 0,
+            'unique_objects': 0
+        }
+
     def _bind_namespaces(self) -> None:
         """Bind all necessary namespaces to the graph."""
         self.graph.bind("music", self.ns)
@@ -124,19 +419,26 @@ class RDFOntologyManager:
         ontology_uri = URIRef("http://example.org/music")
 
         self.graph.add((ontology_uri, RDF.type, OWL.Ontology))
-        self.graph.add((ontology_uri, RDFS.label, Literal(
-            "Music Industry Ontology", datatype=XSD.string)))
+        self.graph.add((ontology_uri, RDFS.label, Literal("Music Industry Ontology")))
         self.graph.add((ontology_uri, RDFS.comment, Literal(
-            "An ontology for representing songs, artists, albums, record labels, genres, and awards in the music industry",
-            datatype=XSD.string
+            "An ontology for representing songs, artists, albums, record labels, genres, and awards in the music industry"
         )))
         self.graph.add((ontology_uri, OWL.versionInfo,
-                       Literal("1.0", datatype=XSD.string)))
+                       Literal("1.0")))
         self.graph.add((ontology_uri, URIRef("http://purl.org/dc/terms/created"),
-                       Literal(datetime.now().isoformat(), datatype=XSD.dateTime)))
+                       self._created_at))
+
+    def _schema_triples(self) -> List[Tuple[Any, Any, Any]]:
+        """
+        Return the class and property definition triples. They do not depend on
+        the reasoner data, so they are built on the first conversion and reused.
+        """
+        if self._schema is None:
+            self._schema = self._class_definitions() + self._property_definitions()
+        return self._schema
 
-    def _add_class_definitions(self) -> None:
-        """Add OWL class definitions to the graph."""
+    def _class_definitions(self) -> List[Tuple[Any, Any, Any]]:
+        """Build the OWL class definition triples."""
         classes = {
             'Song': "A musical composition",
             'Artist': "A person or group who creates or performs music",
@@ -150,415 +452,516 @@ class RDFOntologyManager:
             'SuccessfulLabel': "A record label with multiple award-winning artists",
             'EstablishedArtist': "An artist with multiple albums and awards"
         }
+        triples = []
 
         for class_name, description in classes.items():
             class_uri = self.ns[class_name]
-            self.graph.add((class_uri, RDF.type, OWL.Class))
-            self.graph.add((class_uri, RDFS.label, Literal(
-                class_name, datatype=XSD.string)))
-            self.graph.add((class_uri, RDFS.comment, Literal(
-                description, datatype=XSD.string)))
+            triples.append((class_uri, RDF.type, OWL.Class))
+            triples.append((class_uri, RDFS.label, Literal(class_name)))
+            triples.append((class_uri, RDFS.comment, Literal(description)))
 
         # Add subclass relationships
-        self.graph.add((self.ns.Single, RDFS.subClassOf, self.ns.Song))
-        self.graph.add((self.ns.ExtendedPlay, RDFS.subClassOf, self.ns.Album))
-        self.graph.add((self.ns.CollaborativeSong,
-                       RDFS.subClassOf, self.ns.Song))
-        self.graph.add(
+        triples.append((self.ns.Single, RDFS.subClassOf, self.ns.Song))
+        triples.append((self.ns.ExtendedPlay, RDFS.subClassOf, self.ns.Album))
+        triples.append((self.ns.CollaborativeSong,
+                        RDFS.subClassOf, self.ns.Song))
+        triples.append(
             (self.ns.SuccessfulLabel, RDFS.subClassOf, self.ns.RecordLabel))
-        self.graph.add((self.ns.EstablishedArtist,
-                       RDFS.subClassOf, self.ns.Artist))
+        triples.append((self.ns.EstablishedArtist,
+                        RDFS.subClassOf, self.ns.Artist))
+        return triples
 
-    def _add_property_definitions(self) -> None:
-        """Add property definitions to the graph."""
-        # Data properties
-        data_properties = {
-            'title': (XSD.string, "The title of a song"),
-            'duration': (XSD.int, "The duration of a song in seconds"),
-            'releaseDate': (XSD.date, "The date when a song was released"),
-            'name': (XSD.string, "The name of an artist"),
-            'birthDate': (XSD.date, "The birth date of an artist"),
-            'nationality': (XSD.string, "The nationality of an artist"),
-            'albumTitle': (XSD.string, "The title of an album"),
-            'releaseYear': (XSD.int, "The year when an album was released"),
-            'labelName': (XSD.string, "The name of a record label"),
-            'location': (XSD.string, "The location of a record label"),
-            'genreName': (XSD.string, "The name of a genre"),
-            'description': (XSD.string, "A description of a genre"),
-            'awardName': (XSD.string, "The name of an award"),
-            'year': (XSD.int, "The year an award was given"),
-            'awardingBody': (XSD.string, "The organization that gives the award"),
-            'popularityScore': (XSD.int, "Calculated popularity metric"),
-            'collaborationStrength': (XSD.int, "Numeric measure of collaboration strength"),
-            'labelSuccessRating': (XSD.int, "Success metric for record labels")
-        }
+    def _property_definitions(self) -> List[Tuple[Any, Any, Any]]:
+        """Build the property definition triples."""
+        triples = []
 
-        for prop_name, (datatype, comment) in data_properties.items():
-            prop_uri = self.ns[prop_name]
-            self.graph.add((prop_uri, RDF.type, OWL.DatatypeProperty))
-            self.graph.add((prop_uri, RDFS.label, Literal(
-                prop_name, datatype=XSD.string)))
-            self.graph.add(
-                (prop_uri, RDFS.comment, Literal(comment, datatype=XSD.string)))
-            self.graph.add((prop_uri, RDFS.range, datatype))
+        # Data properties
+        for prop_name, (datatype, comment) in DATA_PROPERTIES.items():
+            prop_uri = self._pred[prop_name]
+            triples.append((prop_uri, RDF.type, OWL.DatatypeProperty))
+            triples.append((prop_uri, RDFS.label, Literal(prop_name)))
+            triples.append(
+                (prop_uri, RDFS.comment, Literal(comment)))
+            triples.append((prop_uri, RDFS.range, XSD[datatype]))
 
         # Object properties
-        object_properties = {
-            'performedBy': "Relates a song to the artist(s) who perform it",
-            'featuredOn': "Relates a song to the album(s) it appears on",
-            'hasGenre': "Relates a song or album to its genre(s)",
-            'hasWonAward': "Relates a song or artist to awards they have won",
-            'signedTo': "Relates an artist to the record label they are signed to",
-            'releasedByArtist': "Relates an album to the artist(s) who released it",
-            'releasedByLabel': "Relates an album to the record label that released it",
-            'collaboratesWith': "Relates artists who have performed songs together",
-            'influencedBy': "Relates artists through genre and collaboration networks",
-            'isContributor': "Relates an entity to albums they contributed to",
-            'contemporaryOf': "Relates artists who were active in the same time period"
-        }
-
-        for prop_name, comment in object_properties.items():
-            prop_uri = self.ns[prop_name]
-            self.graph.add((prop_uri, RDF.type, OWL.ObjectProperty))
-            self.graph.add((prop_uri, RDFS.label, Literal(
-                prop_name, datatype=XSD.string)))
-            self.graph.add(
-                (prop_uri, RDFS.comment, Literal(comment, datatype=XSD.string)))
+        for prop_name, comment in OBJECT_PROPERTIES.items():
+            prop_uri = self._pred[prop_name]
+            triples.append((prop_uri, RDF.type, OWL.ObjectProperty))
+            triples.append((prop_uri, RDFS.label, Literal(prop_name)))
+            triples.append(
+                (prop_uri, RDFS.comment, Literal(comment)))
 
         # Add symmetric property
-        self.graph.add((self.ns.collaboratesWith,
-                       RDF.type, OWL.SymmetricProperty))
+        triples.append((self._pred['collaboratesWith'],
+                        RDF.type, OWL.SymmetricProperty))
 
         # Add transitive property
-        self.graph.add(
-            (self.ns.influencedBy, RDF.type, OWL.TransitiveProperty))
+        triples.append(
+            (self._pred['influencedBy'], RDF.type, OWL.TransitiveProperty))
+        return triples
 
-    def _convert_songs(self) -> None:
-        """Convert song entities to RDF triples."""
+    def _convert_songs(self) -> List[Tuple[Any, Any, Any, Any]]:
+        """Convert song entities to RDF quads."""
         logger.info(f"Converting {len(self.reasoner.songs)} songs to RDF...")
 
-        for song in self.reasoner.songs.values():
+        graph = self.graph
+        songs = self.reasoner.songs
+        artist_keys = self.reasoner.artists.keys()
+        album_keys = self.reasoner.albums.keys()
+        genre_keys = self.reasoner.genres.keys()
+        award_keys = self.reasoner.awards.keys()
+        quads = []
+        add = quads.append
+
+        # Predicate and class URIs hoisted out of the loop
+        rdf_type = RDF.type
+        collaborative_song_class, song_class = (
+            self.ns.CollaborativeSong, self.ns.Song)
+        title_pred = self._pred['title']
+        duration_pred = self._pred['duration']
+        release_date_pred = self._pred['releaseDate']
+        performed_by_pred = self._pred['performedBy']
+        featured_on_pred = self._pred['featuredOn']
+        has_genre_pred = self._pred['hasGenre']
+        has_won_award_pred = self._pred['hasWonAward']
+        converted = 0
+
+        for song in songs.values():
             song_uri = self._create_safe_uri("song", song.id)
 
             # Basic class assertion
             if song.is_collaborative:
-                self.graph.add((song_uri, RDF.type, self.ns.CollaborativeSong))
+                add((song_uri, rdf_type, collaborative_song_class, graph))
             else:
-                self.graph.add((song_uri, RDF.type, self.ns.Song))
+                add((song_uri, rdf_type, song_class, graph))
 
             # Data properties
             if song.title:
-                self.graph.add((song_uri, self.ns.title, Literal(
-                    song.title, datatype=XSD.string)))
+                add((song_uri, title_pred, Literal(song.title), graph))
 
             if song.duration > 0:
-                self.graph.add((song_uri, self.ns.duration,
-                               Literal(song.duration, datatype=XSD.int)))
+                add((song_uri, duration_pred, _lit_int(song.duration), graph))
 
             if song.release_date:
-                self.graph.add((song_uri, self.ns.releaseDate, Literal(
-                    song.release_date.isoformat(), datatype=XSD.date)))
+                add((song_uri, release_date_pred, _lit_date(song.release_date), graph))
 
             # Object properties - artists
-            for artist_id in song.artist_ids:
-                if artist_id in self.reasoner.artists:
-                    artist_uri = self._create_safe_uri("artist", artist_id)
-                    self.graph.add((song_uri, self.ns.performedBy, artist_uri))
+            for artist_id in song.artist_ids & artist_keys:
+                artist_uri = self._create_safe_uri("artist", artist_id)
+                add((song_uri, performed_by_pred, artist_uri, graph))
 
             # Object properties - albums
-            for album_id in song.album_ids:
-                if album_id in self.reasoner.albums:
-                    album_uri = self._create_safe_uri("album", album_id)
-                    self.graph.add((song_uri, self.ns.featuredOn, album_uri))
+            for album_id in song.album_ids & album_keys:
+                album_uri = self._create_safe_uri("album", album_id)
+                add((song_uri, featured_on_pred, album_uri, graph))
 
             # Object properties - genres
-            for genre_id in song.genre_ids:
-                if genre_id in self.reasoner.genres:
-                    genre_uri = self._create_safe_uri("genre", genre_id)
-                    self.graph.add((song_uri, self.ns.hasGenre, genre_uri))
+            for genre_id in song.genre_ids & genre_keys:
+                genre_uri = self._create_safe_uri("genre", genre_id)
+                add((song_uri, has_genre_pred, genre_uri, graph))
 
             # Object properties - awards
-            for award_id in song.award_ids:
-                if award_id in self.reasoner.awards:
-                    award_uri = self._create_safe_uri("award", award_id)
-                    self.graph.add((song_uri, self.ns.hasWonAward, award_uri))
+            for award_id in song.award_ids & award_keys:
+                award_uri = self._create_safe_uri("award", award_id)
+                add((song_uri, has_won_award_pred, award_uri, graph))
+
+            converted += 1
 
-            self.rdf_stats['entity_counts']['songs'] += 1
+        self.rdf_stats['entity_counts']['songs'] += converted
+        return quads
 
-    def _convert_artists(self) -> None:
-        """Convert artist entities to RDF triples."""
+    def _convert_artists(self) -> List[Tuple[Any, Any, Any, Any]]:
+        """Convert artist entities to RDF quads."""
         logger.info(
             f"Converting {len(self.reasoner.artists)} artists to RDF...")
 
-        for artist in self.reasoner.artists.values():
+        graph = self.graph
+        artists = self.reasoner.artists
+        record_labels = self.reasoner.record_labels
+        artist_keys = artists.keys()
+        quads = []
+        add = quads.append
+
+        # Predicate and class URIs hoisted out of the loop
+        rdf_type = RDF.type
+        established_artist_class, artist_class = (
+            self.ns.EstablishedArtist, self.ns.Artist)
+        name_pred = self._pred['name']
+        birth_date_pred = self._pred['birthDate']
+        nationality_pred = self._pred['nationality']
+        popularity_score_pred = self._pred['popularityScore']
+        signed_to_pred = self._pred['signedTo']
+        collaborates_with_pred = self._pred['collaboratesWith']
+        has_collaboration_strength_pred = self._pred['hasCollaborationStrength']
+        with_artist_pred = self._pred['withArtist']
+        collaboration_strength_pred = self._pred['collaborationStrength']
+        influenced_by_pred = self._pred['influencedBy']
+        contemporary_of_pred = self._pred['contemporaryOf']
+        converted = 0
+
+        for artist in artists.values():
             artist_uri = self._create_safe_uri("artist", artist.id)
+            artist_key = self._clean_identifier(artist.id)
 
             # Basic class assertion
             if artist.is_established:
-                self.graph.add(
-                    (artist_uri, RDF.type, self.ns.EstablishedArtist))
+                add((artist_uri, rdf_type, established_artist_class, graph))
             else:
-                self.graph.add((artist_uri, RDF.type, self.ns.Artist))
+                add((artist_uri, rdf_type, artist_class, graph))
 
             # Data properties
             if artist.name:
-                self.graph.add((artist_uri, self.ns.name, Literal(
-                    artist.name, datatype=XSD.string)))
+                add((artist_uri, name_pred, Literal(artist.name), graph))
 
             if artist.birth_date:
-                self.graph.add((artist_uri, self.ns.birthDate, Literal(
-                    artist.birth_date.isoformat(), datatype=XSD.date)))
+                add((artist_uri, birth_date_pred, _lit_date(artist.birth_date), graph))
 
             if artist.nationality:
-                self.graph.add((artist_uri, self.ns.nationality, Literal(
-                    artist.nationality, datatype=XSD.string)))
+                add((artist_uri, nationality_pred, _lit_str(artist.nationality), graph))
 
             if artist.popularity_score > 0:
-                self.graph.add((artist_uri, self.ns.popularityScore, Literal(
-                    artist.popularity_score, datatype=XSD.int)))
+                add((artist_uri, popularity_score_pred,
+                     _lit_int(artist.popularity_score), graph))
 
             # Object properties - label
-            if artist.label_id and artist.label_id in self.reasoner.record_labels:
+            if artist.label_id and artist.label_id in record_labels:
                 label_uri = self._create_safe_uri("label", artist.label_id)
-                self.graph.add((artist_uri, self.ns.signedTo, label_uri))
-
-            # Object properties - collaborations
-            for partner_id in artist.collaboration_partners:
-                if partner_id in self.reasoner.artists:
-                    partner_uri = self._create_safe_uri("artist", partner_id)
-                    self.graph.add(
-                        (artist_uri, self.ns.collaboratesWith, partner_uri))
-
-                    # Add collaboration strength if available
-                    if partner_id in artist.collaboration_strength:
-                        strength = artist.collaboration_strength[partner_id]
-                        # Create a blank node for the qualified relationship
-                        collab_node = BNode()
-                        self.graph.add(
-                            (artist_uri, self.ns.hasCollaborationStrength, collab_node))
-                        self.graph.add(
-                            (collab_node, self.ns.withArtist, partner_uri))
-                        self.graph.add((collab_node, self.ns.collaborationStrength, Literal(
-                            strength, datatype=XSD.int)))
+                add((artist_uri, signed_to_pred, label_uri, graph))
+
+            # Object properties - collaborations (known partners only)
+            for partner_id in artist.collaboration_partners & artist_keys:
+                partner_uri = self._create_safe_uri("artist", partner_id)
+                add((artist_uri, collaborates_with_pred, partner_uri, graph))
+
+                # Add collaboration strength if available
+                if partner_id in artist.collaboration_strength:
+                    strength = artist.collaboration_strength[partner_id]
+                    # Deterministic node for the qualified relationship. Cleaned
+                    # identifiers never contain "__", so it separates them
+                    # unambiguously
+                    collab_node = self.music_ns[
+                        f"collab__{artist_key}__{self._clean_identifier(partner_id)}"]
+                    add((artist_uri, has_collaboration_strength_pred,
+                         collab_node, graph))
+                    add((collab_node, with_artist_pred, partner_uri, graph))
+                    add((collab_node, collaboration_strength_pred,
+                         _lit_int(strength), graph))
 
             # Object properties - influences
-            for influenced_id in artist.influenced_by:
-                if influenced_id in self.reasoner.artists:
-                    influenced_uri = self._create_safe_uri(
-                        "artist", influenced_id)
-                    self.graph.add(
-                        (artist_uri, self.ns.influencedBy, influenced_uri))
+            for influenced_id in artist.influenced_by & artist_keys:
+                influenced_uri = self._create_safe_uri(
+                    "artist", influenced_id)
+                add((artist_uri, influenced_by_pred, influenced_uri, graph))
 
             # Object properties - contemporaries
-            for contemporary_id in artist.contemporary_artists:
-                if contemporary_id in self.reasoner.artists:
-                    contemporary_uri = self._create_safe_uri(
-                        "artist", contemporary_id)
-                    self.graph.add(
-                        (artist_uri, self.ns.contemporaryOf, contemporary_uri))
+            for contemporary_id in artist.contemporary_artists & artist_keys:
+                contemporary_uri = self._create_safe_uri(
+                    "artist", contemporary_id)
+                add((artist_uri, contemporary_of_pred, contemporary_uri, graph))
+
+            converted += 1
 
-            self.rdf_stats['entity_counts']['artists'] += 1
+        self.rdf_stats['entity_counts']['artists'] += converted
+        return quads
 
-    def _convert_albums(self) -> None:
-        """Convert album entities to RDF triples."""
+    def _convert_albums(self) -> List[Tuple[Any, Any, Any, Any]]:
+        """Convert album entities to RDF quads."""
         logger.info(f"Converting {len(self.reasoner.albums)} albums to RDF...")
 
-        for album in self.reasoner.albums.values():
+        graph = self.graph
+        song_keys = self.reasoner.songs.keys()
+        artists = self.reasoner.artists
+        artist_keys = artists.keys()
+        albums = self.reasoner.albums
+        record_labels = self.reasoner.record_labels
+        genre_keys = self.reasoner.genres.keys()
+        quads = []
+        add = quads.append
+
+        # Predicate and class URIs hoisted out of the loop
+        rdf_type = RDF.type
+        album_class = self.ns.Album
+        album_title_pred = self._pred['albumTitle']
+        release_year_pred = self._pred['releaseYear']
+        total_duration_pred = self._pred['totalDuration']
+        released_by_artist_pred = self._pred['releasedByArtist']
+        released_by_label_pred = self._pred['releasedByLabel']
+        has_genre_pred = self._pred['hasGenre']
+        has_inherited_genre_pred = self._pred['hasInheritedGenre']
+        features_pred = self._pred['features']
+        is_contributor_pred = self._pred['isContributor']
+        converted = 0
+
+        for album in albums.values():
             album_uri = self._create_safe_uri("album", album.id)
 
             # Basic class assertion
-            self.graph.add((album_uri, RDF.type, self.ns.Album))
+            add((album_uri, rdf_type, album_class, graph))
 
             # Data properties
             if album.album_title:
-                self.graph.add((album_uri, self.ns.albumTitle, Literal(
-                    album.album_title, datatype=XSD.string)))
+                add((album_uri, album_title_pred, Literal(
+                    album.album_title), graph))
 
             if album.release_year > 0:
-                self.graph.add((album_uri, self.ns.releaseYear, Literal(
-                    album.release_year, datatype=XSD.int)))
+                add((album_uri, release_year_pred, _lit_int(album.release_year), graph))
 
             if album.total_duration > 0:
-                self.graph.add((album_uri, self.ns.totalDuration, Literal(
-                    album.total_duration, datatype=XSD.int)))
+                add((album_uri, total_duration_pred,
+                     _lit_int(album.total_duration), graph))
 
             # Object properties - artists
-            for artist_id in album.artist_ids:
-                if artist_id in self.reasoner.artists:
-                    artist_uri = self._create_safe_uri("artist", artist_id)
-                    self.graph.add(
-                        (album_uri, self.ns.releasedByArtist, artist_uri))
+            for artist_id in album.artist_ids & artist_keys:
+                artist_uri = self._create_safe_uri("artist", artist_id)
+                add((album_uri, released_by_artist_pred, artist_uri, graph))
 
             # Object properties - label
-            if album.label_id and album.label_id in self.reasoner.record_labels:
+            if album.label_id and album.label_id in record_labels:
                 label_uri = self._create_safe_uri("label", album.label_id)
-                self.graph.add((album_uri, self.ns.releasedByLabel, label_uri))
+                add((album_uri, released_by_label_pred, label_uri, graph))
 
             # Object properties - genres (including inherited)
-            for genre_id in album.genre_ids:
-                if genre_id in self.reasoner.genres:
-                    genre_uri = self._create_safe_uri("genre", genre_id)
-                    self.graph.add((album_uri, self.ns.hasGenre, genre_uri))
+            for genre_id in album.genre_ids & genre_keys:
+                genre_uri = self._create_safe_uri("genre", genre_id)
+                add((album_uri, has_genre_pred, genre_uri, graph))
 
-                    # Mark inherited genres
-                    if genre_id in album.inherited_genres:
-                        self.graph.add(
-                            (album_uri, self.ns.hasInheritedGenre, genre_uri))
+                # Mark inherited genres
+                if genre_id in album.inherited_genres:
+                    add((album_uri, has_inherited_genre_pred, genre_uri, graph))
 
             # Object properties - songs
-            for song_id in album.song_ids:
-                if song_id in self.reasoner.songs:
-                    song_uri = self._create_safe_uri("song", song_id)
-                    self.graph.add((album_uri, self.ns.features, song_uri))
+            for song_id in album.song_ids & song_keys:
+                song_uri = self._create_safe_uri("song", song_id)
+                add((album_uri, features_pred, song_uri, graph))
 
             # Object properties - contributors
             for contributor_id in album.contributors:
-                if contributor_id in self.reasoner.artists:
+                if contributor_id in artists:
                     contributor_uri = self._create_safe_uri(
                         "artist", contributor_id)
-                    self.graph.add(
-                        (contributor_uri, self.ns.isContributor, album_uri))
-                elif contributor_id in self.reasoner.record_labels:
+                    add((contributor_uri, is_contributor_pred, album_uri, graph))
+                elif contributor_id in record_labels:
                     contributor_uri = self._create_safe_uri(
                         "label", contributor_id)
-                    self.graph.add(
-                        (contributor_uri, self.ns.isContributor, album_uri))
+                    add((contributor_uri, is_contributor_pred, album_uri, graph))
 
-            self.rdf_stats['entity_counts']['albums'] += 1
+            converted += 1
 
-    def _convert_record_labels(self) -> None:
-        """Convert record label entities to RDF triples."""
+        self.rdf_stats['entity_counts']['albums'] += converted
+        return quads
+
+    def _convert_record_labels(self) -> List[Tuple[Any, Any, Any, Any]]:
+        """Convert record label entities to RDF quads."""
         logger.info(
             f"Converting {len(self.reasoner.record_labels)} record labels to RDF...")
 
-        for label in self.reasoner.record_labels.values():
+        graph = self.graph
+        artist_keys = self.reasoner.artists.keys()
+        record_labels = self.reasoner.record_labels
+        quads = []
+        add = quads.append
+
+        # Predicate and class URIs hoisted out of the loop
+        rdf_type = RDF.type
+        successful_label_class, record_label_class = (
+            self.ns.SuccessfulLabel, self.ns.RecordLabel)
+        label_name_pred = self._pred['labelName']
+        location_pred = self._pred['location']
+        label_success_rating_pred = self._pred['labelSuccessRating']
+        has_signed_artist_pred = self._pred['hasSignedArtist']
+        converted = 0
+
+        for label in record_labels.values():
             label_uri = self._create_safe_uri("label", label.id)
 
             # Basic class assertion
             if label.is_successful:
-                self.graph.add((label_uri, RDF.type, self.ns.SuccessfulLabel))
+                add((label_uri, rdf_type, successful_label_class, graph))
             else:
-                self.graph.add((label_uri, RDF.type, self.ns.RecordLabel))
+                add((label_uri, rdf_type, record_label_class, graph))
 
             # Data properties
             if label.label_name:
-                self.graph.add((label_uri, self.ns.labelName, Literal(
-                    label.label_name, datatype=XSD.string)))
+                add((label_uri, label_name_pred, Literal(
+                    label.label_name), graph))
 
             if label.location:
-                self.graph.add((label_uri, self.ns.location, Literal(
-                    label.location, datatype=XSD.string)))
+                add((label_uri, location_pred, _lit_str(label.location), graph))
 
             if label.success_rating > 0:
-                self.graph.add((label_uri, self.ns.labelSuccessRating, Literal(
-                    label.success_rating, datatype=XSD.int)))
+                add((label_uri, label_success_rating_pred,
+                     _lit_int(label.success_rating), graph))
 
             # TODO: Label doesn't have a 'signed artists' property,
             # need to compute a inverse property 'signed_artists' before the following starts to work...
             # Object properties - signed artists
-            for artist_id in label.signed_artists:
-                if artist_id in self.reasoner.artists:
-                    artist_uri = self._create_safe_uri("artist", artist_id)
-                    self.graph.add(
-                        (label_uri, self.ns.hasSignedArtist, artist_uri))
+            for artist_id in label.signed_artists & artist_keys:
+                artist_uri = self._create_safe_uri("artist", artist_id)
+                add((label_uri, has_signed_artist_pred, artist_uri, graph))
 
-            self.rdf_stats['entity_counts']['record_labels'] += 1
+            converted += 1
 
-    def _convert_genres(self) -> None:
-        """Convert genre entities to RDF triples."""
+        self.rdf_stats['entity_counts']['record_labels'] += converted
+        return quads
+
+    def _convert_genres(self) -> List[Tuple[Any, Any, Any, Any]]:
+        """Convert genre entities to RDF quads."""
         logger.info(f"Converting {len(self.reasoner.genres)} genres to RDF...")
 
-        for genre in self.reasoner.genres.values():
+        graph = self.graph
+        genres = self.reasoner.genres
+        genre_keys = genres.keys()
+        quads = []
+        add = quads.append
+
+        # Predicate and class URIs hoisted out of the loop
+        rdf_type = RDF.type
+        see_also = RDFS.seeAlso
+        genre_class = self.ns.Genre
+        genre_name_pred = self._pred['genreName']
+        description_pred = self._pred['description']
+        converted = 0
+
+        for genre in genres.values():
             genre_uri = self._create_safe_uri("genre", genre.id)
 
             # Basic class assertion
-            self.graph.add((genre_uri, RDF.type, self.ns.Genre))
+            add((genre_uri, rdf_type, genre_class, graph))
 
             # Data properties
             if genre.genre_name:
-                self.graph.add((genre_uri, self.ns.genreName, Literal(
-                    genre.genre_name, datatype=XSD.string)))
+                add((genre_uri, genre_name_pred, _lit_str(genre.genre_name), graph))
 
             if genre.description:
-                self.graph.add((genre_uri, self.ns.description, Literal(
-                    genre.description, datatype=XSD.string)))
+                add((genre_uri, description_pred, Literal(
+                    genre.description), graph))
 
             # Object properties - related genres
-            for related_id in genre.related_genres:
-                if related_id in self.reasoner.genres:
-                    related_uri = self._create_safe_uri("genre", related_id)
-                    self.graph.add((genre_uri, RDFS.seeAlso, related_uri))
+            for related_id in genre.related_genres & genre_keys:
+                related_uri = self._create_safe_uri("genre", related_id)
+                add((genre_uri, see_also, related_uri, graph))
+
+            converted += 1
 
-            self.rdf_stats['entity_counts']['genres'] += 1
+        self.rdf_stats['entity_counts']['genres'] += converted
+        return quads
 
-    def _convert_awards(self) -> None:
-        """Convert award entities to RDF triples."""
+    def _convert_awards(self) -> List[Tuple[Any, Any, Any, Any]]:
+        """Convert award entities to RDF quads."""
         logger.info(f"Converting {len(self.reasoner.awards)} awards to RDF...")
 
-        for award in self.reasoner.awards.values():
+        graph = self.graph
+        song_keys = self.reasoner.songs.keys()
+        artist_keys = self.reasoner.artists.keys()
+        awards = self.reasoner.awards
+        quads = []
+        add = quads.append
+
+        # Predicate and class URIs hoisted out of the loop
+        rdf_type = RDF.type
+        award_class = self.ns.Award
+        award_name_pred = self._pred['awardName']
+        year_pred = self._pred['year']
+        awarding_body_pred = self._pred['awardingBody']
+        award_won_by_pred = self._pred['awardWonBy']
+        converted = 0
+
+        for award in awards.values():
             award_uri = self._create_safe_uri("award", award.id)
 
             # Basic class assertion
-            self.graph.add((award_uri, RDF.type, self.ns.Award))
+            add((award_uri, rdf_type, award_class, graph))
 
             # Data properties
             if award.award_name:
-                self.graph.add((award_uri, self.ns.awardName, Literal(
-                    award.award_name, datatype=XSD.string)))
+                add((award_uri, award_name_pred, _lit_str(award.award_name), graph))
 
             if award.year > 0:
-                self.graph.add(
-                    (award_uri, self.ns.year, Literal(award.year, datatype=XSD.int)))
+                add((award_uri, year_pred, _lit_int(award.year), graph))
 
             if award.awarding_body:
-                self.graph.add((award_uri, self.ns.awardingBody, Literal(
-                    award.awarding_body, datatype=XSD.string)))
+                add((award_uri, awarding_body_pred,
+                     _lit_str(award.awarding_body), graph))
 
             # Object properties - awarded to artists
-            for artist_id in award.artist_ids:
-                if artist_id in self.reasoner.artists:
-                    artist_uri = self._create_safe_uri("artist", artist_id)
-                    self.graph.add((award_uri, self.ns.awardWonBy, artist_uri))
+            for artist_id in award.artist_ids & artist_keys:
+                artist_uri = self._create_safe_uri("artist", artist_id)
+                add((award_uri, award_won_by_pred, artist_uri, graph))
 
             # Object properties - awarded to songs
-            for song_id in award.song_ids:
-                if song_id in self.reasoner.songs:
-                    song_uri = self._create_safe_uri("song", song_id)
-                    self.graph.add((award_uri, self.ns.awardWonBy, song_uri))
+            for song_id in award.song_ids & song_keys:
+                song_uri = self._create_safe_uri("song", song_id)
+                add((award_uri, award_won_by_pred, song_uri, graph))
+
+            converted += 1
 
-            self.rdf_stats['entity_counts']['awards'] += 1
+        self.rdf_stats['entity_counts']['awards'] += converted
+        return quads
 
-    def _add_reasoning_results(self) -> None:
-        """Add additional triples representing reasoning results."""
+    def _add_reasoning_results(self) -> List[Tuple[Any, Any, Any, Any]]:
+        """Build additional quads representing reasoning results."""
         logger.info("Adding reasoning results to RDF graph...")
 
+        songs = self.reasoner.songs
+        artists = self.reasoner.artists
+        record_labels = self.reasoner.record_labels
+
+        # Only entities the conversion did not already type from their flags
+        # (is_collaborative / is_successful / is_established) need a triple
+        graph = self.graph
+        quads = []
+        add = quads.append
+
+        # Predicate and class URIs hoisted out of the loop
+        rdf_type = RDF.type
+        collaborative_song_class, successful_label_class, established_artist_class = (
+            self.ns.CollaborativeSong, self.ns.SuccessfulLabel, self.ns.EstablishedArtist)
+
         # Mark collaborative songs
         for song_id in self.reasoner.collaborative_songs:
-            if song_id in self.reasoner.songs:
+            if song_id in songs and not songs[song_id].is_collaborative:
                 song_uri = self._create_safe_uri("song", song_id)
-                self.graph.add((song_uri, RDF.type, self.ns.CollaborativeSong))
+                add((song_uri, rdf_type, collaborative_song_class, graph))
 
         # Mark successful labels
         for label_id in self.reasoner.successful_labels:
-            if label_id in self.reasoner.record_labels:
+            if label_id in record_labels and not record_labels[label_id].is_successful:
                 label_uri = self._create_safe_uri("label", label_id)
-                self.graph.add((label_uri, RDF.type, self.ns.SuccessfulLabel))
+                add((label_uri, rdf_type, successful_label_class, graph))
 
         # Mark established artists
         for artist_id in self.reasoner.established_artists:
-            if artist_id in self.reasoner.artists:
+            if artist_id in artists and not artists[artist_id].is_established:
                 artist_uri = self._create_safe_uri("artist", artist_id)
-                self.graph.add(
-                    (artist_uri, RDF.type, self.ns.EstablishedArtist))
+                add((artist_uri, rdf_type, established_artist_class, graph))
+
+        return quads
+
+    def _add_quads(self, quads: Iterable[Tuple[Any, Any, Any, Any]]) -> None:
+        """
+        Bulk-insert converted (s, p, o, graph) quads. The Oxigraph store loads
+        them as one N-Triples document through its native parser, which beats
+        converting every term in addN; the in-memory stores take them via addN.
+        """
+        if self.store == 'Oxigraph':
+            self.graph.parse(data="".join(
+                f"{_nt_term(s)} {_nt_term(p)} {_nt_term(o)} .\n" for s, p, o, _ in quads),
+                format='ox-nt')
+        else:
+            self.graph.addN(quads)
 
     def _create_safe_uri(self, prefix: str, identifier: str) -> URIRef:
         """
         Create a safe URI reference with consistent generation.
         Handles special characters and ensures web-safe URIs.
         """
-        cache_key = f"{prefix}_{identifier}"
-        if cache_key in self.uri_cache:
-            return self.uri_cache[cache_key]
+        # Keyed by (prefix, identifier): no per-call key string to build. Converter
+        # threads may race on a miss; both build the same URIRef
+        cache_key = (prefix, identifier)
+        uri = self.uri_cache.get(cache_key)
+        if uri is not None:
+            return uri
 
         clean_id = self._clean_identifier(identifier)
         uri = self.music_ns[f"{prefix}_{clean_id}"]
@@ -576,14 +979,18 @@ class RDFOntologyManager:
         text = str(text)
 
         # Replace problematic characters with underscores
-        cleaned = re.sub(r'[^\w\-_]', '_', text)
+        cleaned = text.translate(_IDENTIFIER_TRANS)
+        if not cleaned.isascii():
+            cleaned = _NON_WORD_RE.sub('_', cleaned)
 
         # Ensure doesn't start with a number
         if cleaned and cleaned[0].isdigit():
             cleaned = f"id_{cleaned}"
 
         # Remove multiple underscores and trailing underscores
-        cleaned = re.sub(r'_+', '_', cleaned).strip('_')
+        if '__' in cleaned:
+            cleaned = _UNDERSCORE_RUN_RE.sub('_', cleaned)
+        cleaned = cleaned.strip('_')
 
         # Ensure not empty
         if not cleaned:
@@ -593,29 +1000,35 @@ class RDFOntologyManager:
 
     def _calculate_rdf_statistics(self) -> None:
         """Calculate comprehensive RDF statistics."""
-        self.rdf_stats['total_triples'] = len(self.graph)
-
-        # Count unique subjects, predicates, objects
-        for s, p, o in self.graph:
-            self.rdf_stats['unique_subjects'].add(s)
-            self.rdf_stats['unique_predicates'].add(p)
-            self.rdf_stats['unique_objects'].add(o)
-            self.rdf_stats['property_usage'][str(p)] += 1
-
-        # Convert sets to counts
-        self.rdf_stats['unique_subjects'] = len(
-            self.rdf_stats['unique_subjects'])
-        self.rdf_stats['unique_predicates'] = len(
-            self.rdf_stats['unique_predicates'])
-        self.rdf_stats['unique_objects'] = len(
-            self.rdf_stats['unique_objects'])
-
-    def export_multiple_formats(self, output_dir: str) -> Dict[str, str]:
+        # One pass over the graph, split into subject/predicate/object columns.
+        # Unpacking the triples() generator rather than the graph itself: that
+        # would take len(graph) first, another walk over every triple
+        subjects, predicates, objects = (
+            tuple(zip(*self.graph.triples((None, None, None)))) or ((), (), ()))
+        predicate_counts = Counter(predicates)
+
+        self.rdf_stats['total_triples'] = len(predicates)
+        self.rdf_stats['property_usage'].update(
+            (str(predicate), count) for predicate, count in predicate_counts.items())
+
+        # Unique subjects, predicates, objects as counts
+        self.rdf_stats['unique_subjects'] = len(set(subjects))
+        self.rdf_stats['unique_predicates'] = len(predicate_counts)
+        self.rdf_stats['unique_objects'] = len(set(objects))
+
+    def export_multiple_formats(self, output_dir: str,
+                                max_workers: Optional[int] = None) -> Dict[str, str]:
         """
         Export RDF graph in multiple serialization formats.
         Returns dictionary mapping format names to file paths.
+
+        The formats are written on a thread pool of max_workers threads; they
+        only read the graph. The default runs one thread per format on the
+        Oxigraph store, whose native serializers run outside the GIL, and a
+        single thread otherwise: rdflib's pure-Python serializers hold the GIL
+        and only slow each other down.
         """
-        if not self.graph:
+        if not self._triple_count:
             raise ValueError("Graph is empty. Run convert_to_rdf() first.")
 
         output_path = Path(output_dir)
@@ -629,36 +1042,109 @@ class RDFOntologyManager:
             'n_triples': ('nt', 'nt')
         }
 
-        exported_files = {}
+        if max_workers is None:
+            max_workers = len(formats) if self.store == 'Oxigraph' else 1
 
-        for format_name, (extension, rdflib_format) in formats.items():
-            try:
-                file_path = output_path / f"music_ontology.{extension}"
-                logger.info(f"Exporting {format_name} format to {file_path}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                format_name: executor.submit(
+                    self._serialize_one, format_name,
+                    output_path / f"music_ontology.{extension}", rdflib_format)
+                for format_name, (extension, rdflib_format) in formats.items()
+            }
+            return {format_name: future.result() for format_name, future in futures.items()}
 
-                # Serialize the graph
-                serialized = self.graph.serialize(format=rdflib_format)
+    def _serialize_one(self, format_name: str, file_path: Path, rdflib_format: str) -> str:
+        """
+        Serialize the graph to one file. Returns the file path, or the error
+        message when the export failed.
+        """
+        try:
+            logger.info(f"Exporting {format_name} format to {file_path}")
 
-                # Write to file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    if isinstance(serialized, bytes):
-                        f.write(serialized.decode('utf-8'))
-                    else:
-                        f.write(serialized)
+            # Serialize the graph straight to the file (natively when backed
+            # by Oxigraph) rather than building the whole document in memory
+            if self.store == 'Oxigraph':
+                rdflib_format = f"ox-{rdflib_format}"
+            self.graph.serialize(destination=str(file_path),
+                                 format=rdflib_format, encoding='utf-8')
 
-                exported_files[format_name] = str(file_path)
-                logger.info(f"Successfully exported {format_name} format")
+            logger.info(f"Successfully exported {format_name} format")
+            return str(file_path)
 
-            except Exception as e:
-                logger.error(f"Failed to export {format_name} format: {e}")
-                exported_files[format_name] = f"Error: {e}"
+        except Exception as e:
+            logger.error(f"Failed to export {format_name} format: {e}")
+            return f"Error: {e}"
 
-        return exported_files
+    def _scan_graph(self) -> GraphScan:
+        """
+        Gather everything validation and reporting need from the graph in one
+        pass: the triples are split into subject/predicate/object columns and
+        counted per distinct term, so URI checks and namespace extraction run
+        once per distinct URI rather than once per occurrence.
+        The scan is kept until the next conversion.
+        """
+        if self._graph_scan is not None:
+            return self._graph_scan
+
+        subjects, predicates, objects = (
+            tuple(zip(*self.graph.triples((None, None, None)))) or ((), (), ()))
+        term_counts = Counter(subjects)
+        term_counts.update(predicates)
+        term_counts.update(objects)
+        uri_counts = {term: count for term, count in term_counts.items()
+                      if type(term) is URIRef}
+
+        invalid_uris = {uri for uri in uri_counts if not self._is_valid_uri(uri)}
+
+        # Namespace usage weighted by URI occurrences: one addition per distinct
+        # URI rather than one count per triple position
+        namespace_usage = Counter()
+        namespace_cache = self._namespace_cache
+        for uri, count in uri_counts.items():
+            namespace = namespace_cache.get(uri)
+            if namespace is None and uri not in namespace_cache:
+                namespace = namespace_cache[uri] = self._extract_namespace(uri)
+            if namespace:
+                namespace_usage[namespace] += count
+
+        subject_uris = {s for s in set(subjects) if type(s) is URIRef}
+        object_uris = {o for o in set(objects) if type(o) is URIRef}
+
+        self._graph_scan = GraphScan(
+            triple_count=len(predicates),
+            subjects=subject_uris,
+            objects=object_uris,
+            uri_counts=uri_counts,
+            invalid_uris=invalid_uris,
+            namespace_usage=dict(namespace_usage),
+            songs_n=len(subject_uris & self._entity_uris('song', self.reasoner.songs)),
+            artists_n=len(subject_uris & self._entity_uris('artist', self.reasoner.artists)),
+            albums_n=len(subject_uris & self._entity_uris('album', self.reasoner.albums))
+        )
+        return self._graph_scan
+
+    def _entity_uris(self, prefix: str, entities: Dict[str, Any]) -> Set[URIRef]:
+        """
+        Return the URIs the conversion gives to one kind of entity. The sets are
+        built once per reasoner data version.
+        """
+        if self._entity_uris_version != self.reasoner.data_version:
+            self._entity_uri_sets.clear()
+            self._entity_uris_version = self.reasoner.data_version
+
+        uris = self._entity_uri_sets.get(prefix)
+        if uris is None:
+            uris = {self._create_safe_uri(prefix, entity_id) for entity_id in entities}
+            self._entity_uri_sets[prefix] = uris
+        return uris
 
-    def validate_rdf_graph(self) -> Dict[str, Any]:
+    def validate_rdf_graph(self, scan: Optional[GraphScan] = None) -> Dict[str, Any]:
         """
         Perform comprehensive validation of the RDF graph.
         Returns validation results and quality metrics.
+
+        scan reuses a GraphScan of the current graph instead of scanning it again.
         """
         logger.info("Validating RDF graph...")
 
@@ -672,33 +1158,21 @@ class RDFOntologyManager:
 
         try:
             # Check for basic graph integrity
-            if len(self.graph) == 0:
+            if scan is None:
+                scan = self._scan_graph()
+            if scan.triple_count == 0:
                 validation_results['errors'].append("Graph is empty")
                 validation_results['is_valid'] = False
                 return validation_results
 
             # Validate URI patterns
-            invalid_uris = []
-            for s, p, o in self.graph:
-                for uri in [s, p, o]:
-                    if isinstance(uri, URIRef):
-                        uri_str = str(uri)
-                        if not self._is_valid_uri(uri_str):
-                            invalid_uris.append(uri_str)
-
-            if invalid_uris:
+            invalid_uri_count = sum(scan.uri_counts[uri] for uri in scan.invalid_uris)
+            if invalid_uri_count:
                 validation_results['warnings'].append(
-                    f"Found {len(invalid_uris)} potentially invalid URIs")
+                    f"Found {invalid_uri_count} potentially invalid URIs")
 
             # Check for dangling references
-            subjects = set()
-            objects = set()
-            for s, p, o in self.graph:
-                if isinstance(s, URIRef):
-                    subjects.add(s)
-                if isinstance(o, URIRef):
-                    objects.add(o)
-
+            subjects, objects = scan.subjects, scan.objects
             dangling_objects = objects - subjects
             if dangling_objects:
                 validation_results['warnings'].append(
@@ -706,13 +1180,13 @@ class RDFOntologyManager:
 
             # Calculate quality metrics
             validation_results['quality_metrics'] = {
-                'uri_consistency_score': 1.0 - (len(invalid_uris) / max(1, len(self.graph))),
+                'uri_consistency_score': 1.0 - (invalid_uri_count / max(1, scan.triple_count)),
                 'reference_integrity_score': 1.0 - (len(dangling_objects) / max(1, len(objects))),
-                'graph_density': len(self.graph) / max(1, len(subjects)),
+                'graph_density': scan.triple_count / max(1, len(subjects)),
                 'entity_coverage': {
-                    'songs_coverage': len([s for s in subjects if 'song_' in str(s)]) / max(1, len(self.reasoner.songs)),
-                    'artists_coverage': len([s for s in subjects if 'artist_' in str(s)]) / max(1, len(self.reasoner.artists)),
-                    'albums_coverage': len([s for s in subjects if 'album_' in str(s)]) / max(1, len(self.reasoner.albums))
+                    'songs_coverage': scan.songs_n / max(1, len(self.reasoner.songs)),
+                    'artists_coverage': scan.artists_n / max(1, len(self.reasoner.artists)),
+                    'albums_coverage': scan.albums_n / max(1, len(self.reasoner.albums))
                 }
             }
 
@@ -727,31 +1201,29 @@ class RDFOntologyManager:
 
     def _is_valid_uri(self, uri_str: str) -> bool:
         """Check if URI string is valid according to basic URI syntax."""
-        try:
-            # Basic URI validation
-            if not uri_str.startswith(('http://', 'https://', 'urn:')):
-                return False
-
-            # Check for invalid characters
-            invalid_chars = [' ', '\t', '\n', '\r']
-            for char in invalid_chars:
-                if char in uri_str:
-                    return False
-
-            return True
-        except Exception:
-            return False
+        # str.startswith: rdflib's Identifier.startswith does not take a tuple
+        return (str.startswith(uri_str, _VALID_URI_PREFIXES)
+                and _URI_WHITESPACE_RE.search(uri_str) is None)
 
-    def generate_rdf_statistics_report(self, output_path: str) -> None:
-        """Generate detailed RDF statistics report in JSON format."""
+    def generate_rdf_statistics_report(self, output_path: str,
+                                       validation_results: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Generate detailed RDF statistics report in JSON format.
+        validation_results reuses the result of an earlier validate_rdf_graph().
+        """
         logger.info(f"Generating RDF statistics report at {output_path}")
 
+        # One scan of the graph feeds both validation and namespace analysis
+        scan = self._scan_graph()
+        if validation_results is None:
+            validation_results = self.validate_rdf_graph(scan=scan)
+
         # Prepare statistics with serializable data
         stats_report = {
             'metadata': {
                 'report_type': 'RDF Statistics Report',
                 'generated_at': datetime.now().isoformat(),
-                'graph_size': len(self.graph)
+                'graph_size': scan.triple_count
             },
             'basic_statistics': {
                 'total_triples': self.rdf_stats['total_triples'],
@@ -760,86 +1232,52 @@ class RDFOntologyManager:
                 'unique_objects': self.rdf_stats['unique_objects']
             },
             'entity_distribution': dict(self.rdf_stats['entity_counts']),
-            'property_usage': dict(sorted(self.rdf_stats['property_usage'].items(),
-                                          key=lambda x: x[1], reverse=True)),
-            'validation_results': self.validate_rdf_graph()
+            'property_usage': dict(self._sorted_property_usage()),
+            'validation_results': validation_results,
+            'namespace_usage': scan.namespace_usage
         }
 
-        # Add namespace analysis
-        namespace_usage = defaultdict(int)
-        for s, p, o in self.graph:
-            for uri in [s, p, o]:
-                if isinstance(uri, URIRef):
-                    namespace = self._extract_namespace(str(uri))
-                    if namespace:
-                        namespace_usage[namespace] += 1
-
-        stats_report['namespace_usage'] = dict(namespace_usage)
-
-        # Save report
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(stats_report, f, indent=2,
-                      default=str, ensure_ascii=False)
+        # Save report. It only holds JSON-native values (str keys, numbers,
+        # strings, lists and dicts), so the encoders need no default= fallback
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(stats_report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(stats_report, f, indent=2, ensure_ascii=False)
 
         logger.info(f"RDF statistics report saved to {output_path}")
 
+    def _sorted_property_usage(self) -> List[Tuple[str, int]]:
+        """Property usage counts, most used first. Sorted once per conversion."""
+        if self._property_usage_ranking is None:
+            self._property_usage_ranking = sorted(
+                self.rdf_stats['property_usage'].items(), key=itemgetter(1), reverse=True)
+        return self._property_usage_ranking
+
     def _extract_namespace(self, uri_str: str) -> Optional[str]:
-        """Extract namespace from URI string."""
-        try:
-            if '#' in uri_str:
-                return uri_str.split('#')[0] + '#'
-            elif '/' in uri_str:
-                parts = uri_str.split('/')
-                if len(parts) > 3:
-                    return '/'.join(parts[:-1]) + '/'
-            return None
-        except Exception:
-            return None
+        """Extract namespace from URI string (a URIRef is one as is)."""
+        # Everything up to the first '#', else up to the last '/' of a URI
+        # with at least three of them
+        head, sep, _ = uri_str.partition('#')
+        if sep:
+            return head + sep
+        head, sep, _ = uri_str.rpartition('/')
+        if sep and uri_str.count('/') >= 3:
+            return head + sep
+        return None
 
     def get_sparql_endpoint_data(self) -> Dict[str, Any]:
         """
         Prepare data for SPARQL querying.
-        Returns graph and useful example queries.
+        Returns graph and useful example queries, both as text and compiled
+        for graph.query().
         """
         return {
             'graph': self.graph,
-            'total_triples': len(self.graph),
-            'example_queries': {
-                'all_collaborative_songs': """
-                    PREFIX music: <http://example.org/music#>
-                    SELECT ?song ?title WHERE {
-                        ?song a music:CollaborativeSong ;
-                              music:title ?title .
-                    }
-                """,
-                'established_artists_with_labels': """
-                    PREFIX music: <http://example.org/music#>
-                    SELECT ?artist ?name ?label WHERE {
-                        ?artist a music:EstablishedArtist ;
-                                music:name ?name ;
-                                music:signedTo ?labelUri .
-                        ?labelUri music:labelName ?label .
-                    }
-                """,
-                'genre_popularity': """
-                    PREFIX music: <http://example.org/music#>
-                    SELECT ?genre ?genreName (COUNT(?song) AS ?songCount) WHERE {
-                        ?song music:hasGenre ?genre .
-                        ?genre music:genreName ?genreName .
-                    }
-                    GROUP BY ?genre ?genreName
-                    ORDER BY DESC(?songCount)
-                """,
-                'collaboration_networks': """
-                    PREFIX music: <http://example.org/music#>
-                    SELECT ?artist1 ?name1 ?artist2 ?name2 WHERE {
-                        ?artist1 music:collaboratesWith ?artist2 ;
-                                 music:name ?name1 .
-                        ?artist2 music:name ?name2 .
-                        FILTER(?artist1 != ?artist2)
-                    }
-                """
-            }
+            'total_triples': self._triple_count,
+            'example_queries': dict(EXAMPLE_QUERIES),
+            'prepared_queries': dict(_prepared_example_queries())
         }
 
 
@@ -849,10 +1287,10 @@ class RDFOntologyUsage:
     Provides simple methods for converting data to RDF and exporting in various formats.
     """
 
-    def __init__(self, reasoner: MusicReasonerEngine):
+    def __init__(self, reasoner: MusicReasonerEngine, store: str = 'SimpleMemory'):
         """Initialize RDF usage interface."""
         self.reasoner = reasoner
-        self.rdf_manager = RDFOntologyManager(reasoner)
+        self.rdf_manager = RDFOntologyManager(reasoner, store=store)
 
     def create_complete_rdf_export(self, output_dir: str = "./data/rdf_output") -> Dict[str, Any]:
         """
@@ -869,13 +1307,14 @@ class RDFOntologyUsage:
             exported_files = self.rdf_manager.export_multiple_formats(
                 output_dir)
 
-            # Generate statistics report
-            stats_path = Path(output_dir) / "rdf_statistics.json"
-            self.rdf_manager.generate_rdf_statistics_report(str(stats_path))
-
             # Validate graph
             validation_results = self.rdf_manager.validate_rdf_graph()
 
+            # Generate statistics report
+            stats_path = Path(output_dir) / "rdf_statistics.json"
+            self.rdf_manager.generate_rdf_statistics_report(
+                str(stats_path), validation_results=validation_results)
+
             # Get SPARQL data
             sparql_data = self.rdf_manager.get_sparql_endpoint_data()
 
@@ -884,7 +1323,7 @@ class RDFOntologyUsage:
                 'exported_files': exported_files,
                 'statistics_report': str(stats_path),
                 'validation_results': validation_results,
-                'graph_size': len(self.rdf_manager.graph),
+                'graph_size': sparql_data['total_triples'],
                 'sparql_queries': sparql_data['example_queries'],
                 'total_triples': sparql_data['total_triples']
             }
@@ -900,13 +1339,9 @@ class RDFOntologyUsage:
         """Quick export to Turtle format only."""
         try:
             self.rdf_manager.convert_to_rdf()
-            serialized = self.rdf_manager.graph.serialize(format='turtle')
-
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if isinstance(serialized, bytes):
-                    f.write(serialized.decode('utf-8'))
-                else:
-                    f.write(serialized)
+            turtle_format = 'ox-turtle' if self.rdf_manager.store == 'Oxigraph' else 'turtle'
+            self.rdf_manager.graph.serialize(
+                destination=output_path, format=turtle_format, encoding='utf-8')
 
             logger.info(f"Quick Turtle export saved to {output_path}")
             return True
@@ -914,6 +1349,24 @@ class RDFOntologyUsage:
             logger.error(f"Quick Turtle export failed: {e}")
             return False
 
+    def quick_nt_export(self, output_path: str) -> bool:
+        """
+        Quick export to N-Triples only. One line per triple, without Turtle's
+        subject grouping and prefix abbreviation: the cheapest format to write
+        for large graphs.
+        """
+        try:
+            self.rdf_manager.convert_to_rdf()
+            nt_format = 'ox-nt' if self.rdf_manager.store == 'Oxigraph' else 'nt'
+            self.rdf_manager.graph.serialize(
+                destination=output_path, format=nt_format, encoding='utf-8')
+
+            logger.info(f"Quick N-Triples export saved to {output_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Quick N-Triples export failed: {e}")
+            return False
+
 
 def main():
     """Example usage of the RDF Ontology Manager."""
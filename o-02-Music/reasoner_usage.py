@@ -4,16 +4,28 @@ Provides comprehensive analytics, reporting, and business intelligence
 for the music industry ontology reasoning system.
 """
 
+import heapq
 import json
 import logging
+import os
+from dataclasses import dataclass
 from datetime import datetime, date
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional, Any, Union
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import GeneratorType
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import the core reasoner
-from music_reasoner import MusicReasonerEngine, normalize_id
+from music_reasoner import Album, MusicReasonerEngine, normalize_id
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +35,91 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_DEBUT = "Release debut album to establish presence"
+_COLLABORATE = "Explore collaborations to expand audience"
+_QUALITY = "Focus on award-worthy quality in next release"
+_AWARDS = "Target award submissions and industry recognition"
+_CONTINUE = "Continue current trajectory toward establishment"
+
+# (album count capped at 2, has collaborators, has awards) -> development recommendation
+_ARTIST_RECOMMENDATIONS = {
+    (0, False, False): _DEBUT, (0, False, True): _DEBUT,
+    (0, True, False): _DEBUT, (0, True, True): _DEBUT,
+    (1, False, False): _COLLABORATE, (1, False, True): _COLLABORATE,
+    (1, True, False): _QUALITY, (1, True, True): _CONTINUE,
+    (2, False, False): _AWARDS, (2, False, True): _CONTINUE,
+    (2, True, False): _QUALITY, (2, True, True): _CONTINUE,
+}
+
+
+def _orjson_default(value: Any) -> Any:
+    """orjson fallback for the entity sets it cannot encode itself."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _json_default(value: Any) -> Any:
+    """json fallback: entity sets become lists, anything else (dates) str()."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _write_json_object(write, items: Iterable[Tuple[str, Any]], level: int = 0) -> None:
+    """
+    Write (key, value) pairs as a JSON object, formatted exactly as
+    orjson.OPT_INDENT_2 would format it nested level objects deep.
+    Generators and dicts of generators are streamed as nested objects;
+    other values are encoded one at a time.
+    """
+    indent = b'\n' + b'  ' * (level + 1)
+    empty = True
+    for key, value in items:
+        write((b'{' if empty else b',') + indent + orjson.dumps(key) + b': ')
+        empty = False
+        if isinstance(value, GeneratorType):
+            _write_json_object(write, value, level + 1)
+        elif (isinstance(value, dict) and value
+              and all(isinstance(nested, GeneratorType) for nested in value.values())):
+            _write_json_object(write, value.items(), level + 1)
+        else:
+            # Strings escape their newlines, so every raw newline is layout
+            write(orjson.dumps(value, default=_orjson_default,
+                               option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                  .replace(b'\n', indent))
+    write(b'{}' if empty else b'\n' + b'  ' * level + b'}')
+
+
+@dataclass
+class SongAggregates:
+    """Song tallies shared by the analyses, gathered in one pass over the songs."""
+    collab_size_counts: Counter            # artist count -> collaborative songs
+    genre_counts: Counter                  # genre id -> songs
+    collab_genre_counts: Counter           # genre id -> collaborative songs
+    release_year_counts: Counter           # release year -> songs
+    genre_artists: Dict[str, Set[str]]     # genre id -> artist ids
+    artist_genres: Dict[str, Set[str]]     # artist id -> genre ids
+    cross_genre_collabs: int
+    orphaned: int                          # songs without artists
+    complete: int                          # songs with artists, genres and a duration
+
+
+@dataclass
+class AlbumAggregates:
+    """Album tallies shared by the analyses, gathered in one pass over the albums."""
+    decade_counts: Counter                 # "1990s" -> albums
+    decade_artist_counts: Counter          # "1990s" -> album artists
+    release_year_counts: Counter           # release year -> albums
+    genre_counts: Counter                  # genre id -> albums
+    albums_with_tracks: List[Album]        # in album order
+    total_tracks: int
+    total_duration: int
+    collaborative: int
+    with_inherited_genres: int
+    orphaned: int                          # albums without artists
+    complete: int                          # albums with artists, a year and songs
+
 
 class MusicAnalytics:
     """
@@ -36,30 +133,118 @@ class MusicAnalytics:
         self.reasoner = reasoner
         self.analysis_timestamp = datetime.now()
 
-    def generate_comprehensive_statistics(self) -> Dict[str, Any]:
+        # Song and album aggregates and the statistics sections, built on
+        # first use for one reasoner state
+        self._song_aggs: Optional[SongAggregates] = None
+        self._album_aggs: Optional[AlbumAggregates] = None
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        self._aggregates_state: Optional[Tuple[int, int]] = None
+
+    def generate_comprehensive_statistics(self, max_workers: int = 1) -> Dict[str, Any]:
         """
         Generate comprehensive statistical analysis of the music industry data.
         Returns detailed metrics covering all aspects of the ontology.
+
+        Every section but the overview is computed once per reasoner state and
+        shared with the section properties below, so treat the result as
+        read-only.
+
+        The result holds only plain dicts, lists, strings and numbers; some
+        dicts have int keys (years, counts), so orjson needs OPT_NON_STR_KEYS.
+
+        With max_workers > 1 the sections run on a thread pool; they only read
+        the reasoner and the shared aggregates, which are built beforehand.
+        The sections are pure Python and hold the GIL, so by default they run
+        one after another.
         """
         logger.info("Generating comprehensive statistics...")
 
-        stats = {
-            'overview': self._generate_overview_stats(),
-            'collaboration_analysis': self._analyze_collaborations(),
-            'genre_analysis': self._analyze_genres(),
-            'artist_analysis': self._analyze_artists(),
-            'album_analysis': self._analyze_albums(),
-            'label_analysis': self._analyze_labels(),
-            'award_analysis': self._analyze_awards(),
-            'influence_network': self._analyze_influence_network(),
-            'temporal_analysis': self._analyze_temporal_patterns(),
-            'quality_metrics': self._calculate_quality_metrics(),
-            'business_insights': self._extract_business_insights()
+        sections = {
+            'collaboration_analysis': self._analyze_collaborations,
+            'genre_analysis': self._analyze_genres,
+            'artist_analysis': self._analyze_artists,
+            'album_analysis': self._analyze_albums,
+            'label_analysis': self._analyze_labels,
+            'award_analysis': self._analyze_awards,
+            'influence_network': self._analyze_influence_network,
+            'temporal_analysis': self._analyze_temporal_patterns,
+            'quality_metrics': self._calculate_quality_metrics,
+            'business_insights': self._extract_business_insights
         }
 
+        stats = {'overview': self._generate_overview_stats()}
+        if max_workers > 1:
+            self._song_aggregates()
+            self._album_aggregates()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {name: executor.submit(self._section, name, analyze)
+                           for name, analyze in sections.items()}
+                stats.update((name, future.result()) for name, future in futures.items())
+        else:
+            stats.update((name, self._section(name, analyze))
+                         for name, analyze in sections.items())
+
         logger.info("Comprehensive statistics generation completed")
         return stats
 
+    def _section(self, name: str, analyze) -> Dict[str, Any]:
+        """Return a statistics section, computing it once per reasoner state."""
+        self._refresh_aggregates()
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = analyze()
+        return section
+
+    @property
+    def collaboration_analysis(self) -> Dict[str, Any]:
+        """Collaboration patterns and relationships."""
+        return self._section('collaboration_analysis', self._analyze_collaborations)
+
+    @property
+    def genre_analysis(self) -> Dict[str, Any]:
+        """Genre distribution and relationships."""
+        return self._section('genre_analysis', self._analyze_genres)
+
+    @property
+    def artist_analysis(self) -> Dict[str, Any]:
+        """Artist statistics and achievements."""
+        return self._section('artist_analysis', self._analyze_artists)
+
+    @property
+    def album_analysis(self) -> Dict[str, Any]:
+        """Album statistics and trends."""
+        return self._section('album_analysis', self._analyze_albums)
+
+    @property
+    def label_analysis(self) -> Dict[str, Any]:
+        """Record label performance and success metrics."""
+        return self._section('label_analysis', self._analyze_labels)
+
+    @property
+    def award_analysis(self) -> Dict[str, Any]:
+        """Award distribution and patterns."""
+        return self._section('award_analysis', self._analyze_awards)
+
+    @property
+    def influence_network(self) -> Dict[str, Any]:
+        """Influence network structure and patterns."""
+        return self._section('influence_network', self._analyze_influence_network)
+
+    @property
+    def temporal_analysis(self) -> Dict[str, Any]:
+        """Release timeline and decade patterns."""
+        return self._section('temporal_analysis', self._analyze_temporal_patterns)
+
+    @property
+    def quality_metrics(self) -> Dict[str, Any]:
+        """Data quality and completeness metrics."""
+        return self._section('quality_metrics', self._calculate_quality_metrics)
+
+    @property
+    def business_insights(self) -> Dict[str, Any]:
+        """Actionable business insights."""
+        return self._section('business_insights', self._extract_business_insights)
+
     def _generate_overview_stats(self) -> Dict[str, Any]:
         """Generate high-level overview statistics."""
         return {
@@ -95,48 +280,31 @@ class MusicAnalytics:
         }
 
         # Analyze collaboration distribution
-        collab_counts = Counter()
-        for song in self.reasoner.songs.values():
-            if song.is_collaborative:
-                collab_counts[len(song.artist_ids)] += 1
-
-        collaboration_stats['collaboration_distribution'] = dict(collab_counts)
-
-        # Find most collaborative artists
-        artist_collab_counts = []
-        for artist in self.reasoner.artists.values():
-            collab_count = len(artist.collaboration_partners)
-            if collab_count > 0:
-                artist_collab_counts.append({
-                    'artist_id': artist.id,
-                    'artist_name': artist.name,
-                    'collaboration_count': collab_count,
-                    'total_collaboration_strength': sum(artist.collaboration_strength.values())
-                })
-
-        # Sort by collaboration count and take top 10
-        artist_collab_counts.sort(
-            key=lambda x: x['collaboration_count'], reverse=True)
-        collaboration_stats['most_collaborative_artists'] = artist_collab_counts[:10]
-
-        # Calculate network density
+        collaboration_stats['collaboration_distribution'] = dict(
+            self._song_aggregates().collab_size_counts)
+
+        # Find the top 10 most collaborative artists
+        most_collaborative = heapq.nlargest(
+            10, (artist for artist in self.reasoner.artists.values()
+                 if artist.collaboration_partners),
+            key=lambda artist: len(artist.collaboration_partners))
+        collaboration_stats['most_collaborative_artists'] = [{
+            'artist_id': artist.id,
+            'artist_name': artist.name,
+            'collaboration_count': len(artist.collaboration_partners),
+            'total_collaboration_strength': sum(artist.collaboration_strength.values())
+        } for artist in most_collaborative]
+
+        # Calculate network density (left at 0.0 with fewer than two artists)
         total_artists = len(self.reasoner.artists)
-        if total_artists > 1:
-            max_possible_collaborations = total_artists * \
-                (total_artists - 1) // 2
+        max_possible_collaborations = total_artists * (total_artists - 1) // 2
+        if max_possible_collaborations:
             actual_collaborations = sum(
-                len(partners) for partners in self.reasoner.collaboration_network.values()) // 2
-            if max_possible_collaborations > 0:
-                collaboration_stats['collaboration_network_density'] = actual_collaborations / \
-                    max_possible_collaborations
-                collaboration_stats['average_collaborations_per_artist'] = (
-                    actual_collaborations * 2) / total_artists
-            else:
-                collaboration_stats['collaboration_network_density'] = 0.0
-                collaboration_stats['average_collaborations_per_artist'] = 0.0
-        else:
-            collaboration_stats['collaboration_network_density'] = 0.0
-            collaboration_stats['average_collaborations_per_artist'] = 0.0
+                map(len, self.reasoner.collaboration_network.values())) // 2
+            collaboration_stats['collaboration_network_density'] = actual_collaborations / \
+                max_possible_collaborations
+            collaboration_stats['average_collaborations_per_artist'] = (
+                actual_collaborations * 2) / total_artists
 
         return collaboration_stats
 
@@ -150,52 +318,184 @@ class MusicAnalytics:
             'cross_genre_collaborations': 0
         }
 
-        # Calculate genre popularity based on song and album associations
-        genre_popularity = Counter()
-        for song in self.reasoner.songs.values():
-            for genre_id in song.genre_ids:
-                genre_popularity[genre_id] += 1
+        genres = self.reasoner.genres
+        song_aggs = self._song_aggregates()
 
-        for album in self.reasoner.albums.values():
-            for genre_id in album.genre_ids:
-                # Weight albums less than individual songs
-                genre_popularity[genre_id] += 0.5
+        # Calculate genre popularity based on song and album associations
+        genre_popularity = Counter(song_aggs.genre_counts)
+        for genre_id, album_count in self._album_aggregates().genre_counts.items():
+            # Weight albums less than individual songs
+            genre_popularity[genre_id] += 0.5 * album_count
 
         # Create genre popularity list with names
         genre_pop_list = []
         for genre_id, count in genre_popularity.most_common(10):
-            if genre_id in self.reasoner.genres:
+            if genre_id in genres:
                 genre_pop_list.append({
                     'genre_id': genre_id,
-                    'genre_name': self.reasoner.genres[genre_id].genre_name,
+                    'genre_name': genres[genre_id].genre_name,
                     'popularity_score': count
                 })
 
         genre_stats['genre_popularity'] = genre_pop_list
 
         # Analyze genre diversity by artist
+        artist_genre_index = song_aggs.artist_genres
+        genre_diversity = genre_stats['genre_diversity_by_artist']
         for artist in self.reasoner.artists.values():
-            artist_genres = set()
-            for song in self.reasoner.songs.values():
-                if artist.id in song.artist_ids:
-                    artist_genres.update(song.genre_ids)
+            artist_genres = artist_genre_index.get(artist.id, ())
 
             if artist_genres:
-                genre_stats['genre_diversity_by_artist'][artist.id] = {
+                genre_diversity[artist.id] = {
                     'artist_name': artist.name,
                     'genre_count': len(artist_genres),
-                    'genres': [self.reasoner.genres[g].genre_name for g in artist_genres if g in self.reasoner.genres]
+                    'genres': [genres[g].genre_name for g in artist_genres if g in genres]
                 }
 
         # Count cross-genre collaborations
-        cross_genre_collabs = 0
+        genre_stats['cross_genre_collaborations'] = song_aggs.cross_genre_collabs
+
+        return genre_stats
+
+    def _refresh_aggregates(self) -> None:
+        """
+        Drop the aggregates and sections once the reasoner reloaded its data or
+        reran its rules.
+        """
+        state = (self.reasoner.data_version, self.reasoner.reasoning_version)
+        if self._aggregates_state != state:
+            self._song_aggs = self._album_aggs = None
+            self._sections = {}
+            self._aggregates_state = state
+
+    def _song_aggregates(self) -> SongAggregates:
+        """Tally everything the analyses need from the songs in a single pass."""
+        self._refresh_aggregates()
+        if self._song_aggs is not None:
+            return self._song_aggs
+
+        collab_size_counts = Counter()
+        genre_counts = Counter()
+        collab_genre_counts = Counter()
+        release_year_counts = Counter()
+        genre_artists = defaultdict(set)
+        artist_genres = defaultdict(set)
+        cross_genre_collabs = orphaned = complete = 0
+
         for song in self.reasoner.songs.values():
-            if song.is_collaborative and len(song.genre_ids) > 1:
-                cross_genre_collabs += 1
+            artist_ids, genre_ids = song.artist_ids, song.genre_ids
+            for genre_id in genre_ids:
+                genre_counts[genre_id] += 1
+                for artist_id in artist_ids:
+                    genre_artists[genre_id].add(artist_id)
+            for artist_id in artist_ids:
+                artist_genres[artist_id].update(genre_ids)
 
-        genre_stats['cross_genre_collaborations'] = cross_genre_collabs
+            if song.is_collaborative:
+                collab_size_counts[len(artist_ids)] += 1
+                for genre_id in genre_ids:
+                    collab_genre_counts[genre_id] += 1
+                if len(genre_ids) > 1:
+                    cross_genre_collabs += 1
 
-        return genre_stats
+            if song.release_date:
+                release_year_counts[song.release_date.year] += 1
+
+            if not artist_ids:
+                orphaned += 1
+            elif genre_ids and song.duration > 0:
+                complete += 1
+
+        self._song_aggs = SongAggregates(
+            collab_size_counts=collab_size_counts,
+            genre_counts=genre_counts,
+            collab_genre_counts=collab_genre_counts,
+            release_year_counts=release_year_counts,
+            genre_artists=dict(genre_artists),
+            artist_genres=dict(artist_genres),
+            cross_genre_collabs=cross_genre_collabs,
+            orphaned=orphaned,
+            complete=complete
+        )
+        return self._song_aggs
+
+    def _album_aggregates(self) -> AlbumAggregates:
+        """Tally everything the analyses need from the albums in a single pass."""
+        self._refresh_aggregates()
+        if self._album_aggs is not None:
+            return self._album_aggs
+
+        albums = self.reasoner.albums
+        release_year_counts = Counter()
+        genre_counts = Counter()
+        albums_with_tracks = []
+        total_tracks = total_duration = 0
+        collaborative = with_inherited_genres = orphaned = complete = 0
+
+        # Decade analysis: album and artist counts per decade with np.bincount
+        release_years = np.fromiter((album.release_year for album in albums.values()),
+                                    dtype=np.int64, count=len(albums))
+        album_artist_counts = np.fromiter((len(album.artist_ids) for album in albums.values()),
+                                          dtype=np.int64, count=len(albums))
+        released = release_years > 0
+        decades, first_seen, decade_index = np.unique(
+            release_years[released] // 10 * 10, return_index=True, return_inverse=True)
+        albums_per_decade = np.bincount(decade_index, minlength=len(decades))
+        artists_per_decade = np.bincount(decade_index, weights=album_artist_counts[released],
+                                         minlength=len(decades)).astype(np.int64)
+
+        # Key the decades in order of first appearance, as most_common breaks ties by it
+        decade_counts = Counter()
+        decade_artist_counts = Counter()
+        for i in np.argsort(first_seen, kind='stable').tolist():
+            decade = f"{decades[i]}s"
+            decade_counts[decade] = int(albums_per_decade[i])
+            decade_artist_counts[decade] = int(artists_per_decade[i])
+
+        for album in albums.values():
+            if album.release_year > 0:
+                release_year_counts[album.release_year] += 1
+
+            for genre_id in album.genre_ids:
+                genre_counts[genre_id] += 1
+
+            # Track and duration analysis
+            track_count = len(album.song_ids)
+            total_tracks += track_count
+
+            total_duration += album.total_duration
+
+            # Collaborative album analysis
+            if len(album.artist_ids) > 1:
+                collaborative += 1
+
+            # Genre inheritance analysis
+            if album.inherited_genres:
+                with_inherited_genres += 1
+
+            if not album.artist_ids:
+                orphaned += 1
+            elif album.release_year > 0 and album.song_ids:
+                complete += 1
+
+            # Track count analysis
+            if track_count > 0:
+                albums_with_tracks.append(album)
+
+        self._album_aggs = AlbumAggregates(
+            decade_counts=decade_counts,
+            decade_artist_counts=decade_artist_counts,
+            release_year_counts=release_year_counts,
+            genre_counts=genre_counts,
+            albums_with_tracks=albums_with_tracks,
+            total_tracks=total_tracks,
+            total_duration=total_duration,
+            collaborative=collaborative,
+            with_inherited_genres=with_inherited_genres,
+            orphaned=orphaned,
+            complete=complete
+        )
+        return self._album_aggs
 
     def _analyze_artists(self) -> Dict[str, Any]:
         """Analyze artist statistics and achievements."""
@@ -204,51 +504,54 @@ class MusicAnalytics:
             'established_artists': len(self.reasoner.established_artists),
             'top_artists_by_popularity': [],
             'artist_career_stages': {},
-            'nationality_distribution': Counter(),
-            'label_distribution': Counter()
+            'nationality_distribution': {},
+            'label_distribution': {}
         }
 
-        # Analyze top artists by popularity score
-        artist_popularity = []
-        for artist in self.reasoner.artists.values():
-            if artist.popularity_score > 0:
-                artist_popularity.append({
-                    'artist_id': artist.id,
-                    'artist_name': artist.name,
-                    'popularity_score': artist.popularity_score,
-                    'award_count': artist.award_count,
-                    'collaboration_count': len(artist.collaboration_partners),
-                    'album_count': artist.album_count,
-                    'is_established': artist.is_established
-                })
-
-        artist_popularity.sort(
-            key=lambda x: x['popularity_score'], reverse=True)
-        artist_stats['top_artists_by_popularity'] = artist_popularity[:15]
-
-        # Analyze career stages
-        career_stages = {'emerging': 0, 'developing': 0,
-                         'established': 0, 'veteran': 0}
-        for artist in self.reasoner.artists.values():
-            if artist.is_established:
-                if artist.album_count >= 5:
-                    career_stages['veteran'] += 1
-                else:
-                    career_stages['established'] += 1
-            elif artist.album_count >= 2:
-                career_stages['developing'] += 1
-            else:
-                career_stages['emerging'] += 1
-
-        artist_stats['artist_career_stages'] = career_stages
+        artists = list(self.reasoner.artists.values())
+        record_labels = self.reasoner.record_labels
+
+        # Per-artist fields as parallel arrays, so the stage counts and the
+        # popularity ranking are numpy reductions rather than a Python loop
+        popularity = np.fromiter((artist.popularity_score for artist in artists),
+                                 dtype=np.int64, count=len(artists))
+        album_counts = np.fromiter((artist.album_count for artist in artists),
+                                   dtype=np.int64, count=len(artists))
+        established = np.fromiter((artist.is_established for artist in artists),
+                                  dtype=bool, count=len(artists))
+
+        # Career stages
+        career_stages = {
+            'emerging': int(np.count_nonzero(~established & (album_counts < 2))),
+            'developing': int(np.count_nonzero(~established & (album_counts >= 2))),
+            'established': int(np.count_nonzero(established & (album_counts < 5))),
+            'veteran': int(np.count_nonzero(established & (album_counts >= 5)))
+        }
 
         # Nationality and label distribution
-        for artist in self.reasoner.artists.values():
-            if artist.nationality:
-                artist_stats['nationality_distribution'][artist.nationality] += 1
-            if artist.label_id and artist.label_id in self.reasoner.record_labels:
-                label_name = self.reasoner.record_labels[artist.label_id].label_name
-                artist_stats['label_distribution'][label_name] += 1
+        nationality_distribution = Counter(
+            artist.nationality for artist in artists if artist.nationality)
+        label_distribution = Counter(
+            record_labels[artist.label_id].label_name for artist in artists
+            if artist.label_id and artist.label_id in record_labels)
+
+        # Top artists by popularity score; the stable sort keeps ties in
+        # catalogue order
+        popular = np.flatnonzero(popularity > 0)
+        top_popular = popular[np.argsort(-popularity[popular], kind='stable')[:15]]
+
+        artist_stats['top_artists_by_popularity'] = [{
+            'artist_id': artist.id,
+            'artist_name': artist.name,
+            'popularity_score': artist.popularity_score,
+            'award_count': artist.award_count,
+            'collaboration_count': len(artist.collaboration_partners),
+            'album_count': artist.album_count,
+            'is_established': artist.is_established
+        } for artist in map(artists.__getitem__, top_popular.tolist())]
+        artist_stats['artist_career_stages'] = career_stages
+        artist_stats['nationality_distribution'] = dict(nationality_distribution)
+        artist_stats['label_distribution'] = dict(label_distribution)
 
         return artist_stats
 
@@ -256,73 +559,39 @@ class MusicAnalytics:
         """Analyze album statistics and trends."""
         album_stats = {
             'total_albums': len(self.reasoner.albums),
-            'albums_by_decade': Counter(),
+            'albums_by_decade': {},
             'average_album_length': 0.0,
             'collaborative_albums': 0,
             'top_albums_by_track_count': [],
             'genre_inheritance_success': 0
         }
 
-        total_tracks = 0
-        total_duration = 0
-        collaborative_albums = 0
-        albums_with_inherited_genres = 0
-
-        track_count_list = []
-
-        for album in self.reasoner.albums.values():
-            # Decade analysis
-            if album.release_year > 0:
-                decade = (album.release_year // 10) * 10
-                album_stats['albums_by_decade'][f"{decade}s"] += 1
-
-            # Track and duration analysis
-            track_count = len(album.song_ids)
-            total_tracks += track_count
-
-            # Calculate album duration from constituent songs
-            album_duration = 0
-            for song_id in album.song_ids:
-                if song_id in self.reasoner.songs:
-                    album_duration += self.reasoner.songs[song_id].duration
-
-            album.total_duration = album_duration
-            total_duration += album_duration
-
-            # Collaborative album analysis
-            if len(album.artist_ids) > 1:
-                collaborative_albums += 1
-
-            # Genre inheritance analysis
-            if album.inherited_genres:
-                albums_with_inherited_genres += 1
-
-            # Track count analysis
-            if track_count > 0:
-                track_count_list.append({
-                    'album_id': album.id,
-                    'album_title': album.album_title,
-                    'track_count': track_count,
-                    'total_duration_minutes': album_duration // 60,
-                    'artist_names': [self.reasoner.artists[aid].name for aid in album.artist_ids if aid in self.reasoner.artists]
-                })
+        album_aggs = self._album_aggregates()
+        album_stats['albums_by_decade'] = dict(album_aggs.decade_counts)
 
         # Calculate averages
         if len(self.reasoner.albums) > 0:
-            album_stats['average_tracks_per_album'] = total_tracks / \
+            album_stats['average_tracks_per_album'] = album_aggs.total_tracks / \
                 len(self.reasoner.albums)
             album_stats['average_album_duration_minutes'] = (
-                total_duration // 60) / len(self.reasoner.albums)
+                album_aggs.total_duration // 60) / len(self.reasoner.albums)
         else:
             album_stats['average_tracks_per_album'] = 0.0
             album_stats['average_album_duration_minutes'] = 0.0
 
-        album_stats['collaborative_albums'] = collaborative_albums
-        album_stats['genre_inheritance_success'] = albums_with_inherited_genres
+        album_stats['collaborative_albums'] = album_aggs.collaborative
+        album_stats['genre_inheritance_success'] = album_aggs.with_inherited_genres
 
         # Top albums by track count
-        track_count_list.sort(key=lambda x: x['track_count'], reverse=True)
-        album_stats['top_albums_by_track_count'] = track_count_list[:10]
+        artists = self.reasoner.artists
+        album_stats['top_albums_by_track_count'] = [{
+            'album_id': album.id,
+            'album_title': album.album_title,
+            'track_count': len(album.song_ids),
+            'total_duration_minutes': album.total_duration // 60,
+            'artist_names': [artists[aid].name for aid in album.artist_ids if aid in artists]
+        } for album in heapq.nlargest(10, album_aggs.albums_with_tracks,
+                                      key=lambda album: len(album.song_ids))]
 
         return album_stats
 
@@ -337,7 +606,7 @@ class MusicAnalytics:
         }
 
         # Analyze top labels by success rating
-        label_success_list = []
+        rated_labels = []
         total_signed_artists = 0
 
         for label in self.reasoner.record_labels.values():
@@ -345,19 +614,18 @@ class MusicAnalytics:
             total_signed_artists += artist_count
 
             if label.success_rating > 0 or artist_count > 0:
-                label_success_list.append({
-                    'label_id': label.id,
-                    'label_name': label.label_name,
-                    'success_rating': label.success_rating,
-                    'signed_artists_count': artist_count,
-                    'award_winning_artists_count': len(label.award_winning_artists),
-                    'is_successful': label.is_successful,
-                    'location': label.location
-                })
+                rated_labels.append(label)
 
-        label_success_list.sort(
-            key=lambda x: x['success_rating'], reverse=True)
-        label_stats['top_labels_by_success_rating'] = label_success_list[:10]
+        label_stats['top_labels_by_success_rating'] = [{
+            'label_id': label.id,
+            'label_name': label.label_name,
+            'success_rating': label.success_rating,
+            'signed_artists_count': len(label.signed_artists),
+            'award_winning_artists_count': len(label.award_winning_artists),
+            'is_successful': label.is_successful,
+            'location': label.location
+        } for label in heapq.nlargest(10, rated_labels,
+                                      key=lambda label: label.success_rating)]
 
         # Calculate average artists per label
         if len(self.reasoner.record_labels) > 0:
@@ -387,27 +655,35 @@ class MusicAnalytics:
         """Analyze award distribution and patterns."""
         award_stats = {
             'total_awards': len(self.reasoner.awards),
-            'awards_by_year': Counter(),
-            'awards_by_body': Counter(),
+            'awards_by_year': {},
+            'awards_by_body': {},
             'most_awarded_artists': [],
             'most_awarded_songs': [],
             'award_distribution': {}
         }
 
-        # Year and awarding body analysis
+        # Year, awarding body, artist and song tallies in one pass over the awards
+        awards_by_year = Counter()
+        awards_by_body = Counter()
+        artist_award_counts = Counter()
+        song_award_counts = Counter()
+        artists, songs = self.reasoner.artists, self.reasoner.songs
         for award in self.reasoner.awards.values():
             if award.year > 0:
-                award_stats['awards_by_year'][award.year] += 1
+                awards_by_year[award.year] += 1
             if award.awarding_body:
-                award_stats['awards_by_body'][award.awarding_body] += 1
-
-        # Most awarded artists
-        artist_award_counts = Counter()
-        for award in self.reasoner.awards.values():
+                awards_by_body[award.awarding_body] += 1
             for artist_id in award.artist_ids:
-                if artist_id in self.reasoner.artists:
+                if artist_id in artists:
                     artist_award_counts[artist_id] += 1
+            for song_id in award.song_ids:
+                if song_id in songs:
+                    song_award_counts[song_id] += 1
+
+        award_stats['awards_by_year'] = dict(awards_by_year)
+        award_stats['awards_by_body'] = dict(awards_by_body)
 
+        # Most awarded artists
         most_awarded_artists = []
         for artist_id, count in artist_award_counts.most_common(10):
             most_awarded_artists.append({
@@ -419,12 +695,6 @@ class MusicAnalytics:
         award_stats['most_awarded_artists'] = most_awarded_artists
 
         # Most awarded songs
-        song_award_counts = Counter()
-        for award in self.reasoner.awards.values():
-            for song_id in award.song_ids:
-                if song_id in self.reasoner.songs:
-                    song_award_counts[song_id] += 1
-
         most_awarded_songs = []
         for song_id, count in song_award_counts.most_common(10):
             most_awarded_songs.append({
@@ -448,43 +718,36 @@ class MusicAnalytics:
         }
 
         # Calculate total influence relationships
-        total_influences = sum(
-            len(influences) for influences in self.reasoner.influence_network.values())
+        total_influences = sum(map(len, self.reasoner.influence_network.values()))
         influence_stats['total_influence_relationships'] = total_influences
 
         # Most influential artists (those who influence many others)
-        influential_artists = []
-        for artist in self.reasoner.artists.values():
-            influence_count = len(artist.influences)
-            if influence_count > 0:
-                influential_artists.append({
-                    'artist_id': artist.id,
-                    'artist_name': artist.name,
-                    'influences_count': influence_count,
-                    'influenced_by_count': len(artist.influenced_by)
-                })
+        influential_artists = [artist for artist in self.reasoner.artists.values()
+                               if artist.influences]
+
+        def influence_entry(artist) -> Dict[str, Any]:
+            return {
+                'artist_id': artist.id,
+                'artist_name': artist.name,
+                'influences_count': len(artist.influences),
+                'influenced_by_count': len(artist.influenced_by)
+            }
 
-        influential_artists.sort(
-            key=lambda x: x['influences_count'], reverse=True)
-        influence_stats['most_influential_artists'] = influential_artists[:10]
+        influence_stats['most_influential_artists'] = [
+            influence_entry(artist) for artist in heapq.nlargest(
+                10, influential_artists, key=lambda artist: len(artist.influences))]
 
         # Most influenced artists (those influenced by many others)
-        influenced_artists = influential_artists.copy()
-        influenced_artists.sort(
-            key=lambda x: x['influenced_by_count'], reverse=True)
-        influence_stats['most_influenced_artists'] = influenced_artists[:10]
+        influence_stats['most_influenced_artists'] = [
+            influence_entry(artist) for artist in heapq.nlargest(
+                10, influential_artists, key=lambda artist: len(artist.influenced_by))]
 
-        # Calculate network density
+        # Calculate network density (left at 0.0 with fewer than two artists)
         total_artists = len(self.reasoner.artists)
-        if total_artists > 1:
-            max_possible_influences = total_artists * (total_artists - 1)
-            if max_possible_influences > 0:
-                influence_stats['influence_network_density'] = total_influences / \
-                    max_possible_influences
-            else:
-                influence_stats['influence_network_density'] = 0.0
-        else:
-            influence_stats['influence_network_density'] = 0.0
+        max_possible_influences = total_artists * (total_artists - 1)
+        if max_possible_influences:
+            influence_stats['influence_network_density'] = total_influences / \
+                max_possible_influences
 
         return influence_stats
 
@@ -497,16 +760,13 @@ class MusicAnalytics:
             'decade_popularity': {}
         }
 
-        # Release timeline analysis
-        release_years = Counter()
-        for album in self.reasoner.albums.values():
-            if album.release_year > 0:
-                release_years[album.release_year] += 1
+        album_aggs = self._album_aggregates()
 
-        for song in self.reasoner.songs.values():
-            if song.release_date:
-                # Weight songs less than albums
-                release_years[song.release_date.year] += 0.5
+        # Release timeline analysis
+        release_years = Counter(album_aggs.release_year_counts)
+        for year, song_count in self._song_aggregates().release_year_counts.items():
+            # Weight songs less than albums
+            release_years[year] += 0.5 * song_count
 
         temporal_stats['release_timeline'] = dict(release_years.most_common())
 
@@ -521,14 +781,8 @@ class MusicAnalytics:
             contemporary_clusters)
 
         # Decade popularity analysis
-        decade_activity = Counter()
-        for album in self.reasoner.albums.values():
-            if album.release_year > 0:
-                decade = (album.release_year // 10) * 10
-                decade_activity[f"{decade}s"] += len(album.artist_ids)
-
         temporal_stats['decade_popularity'] = dict(
-            decade_activity.most_common())
+            album_aggs.decade_artist_counts.most_common())
 
         return temporal_stats
 
@@ -540,15 +794,20 @@ class MusicAnalytics:
             'data_consistency': {}
         }
 
-        # Completeness scores
-        songs_with_complete_data = sum(1 for song in self.reasoner.songs.values()
-                                       if song.artist_ids and song.genre_ids and song.duration > 0)
+        song_aggs = self._song_aggregates()
+        album_aggs = self._album_aggregates()
 
-        artists_with_complete_data = sum(1 for artist in self.reasoner.artists.values()
-                                         if artist.name and artist.nationality and artist.birth_date)
+        # Artist completeness and label coverage, counted in one pass
+        artists_with_complete_data = unsigned_artists = 0
+        for artist in self.reasoner.artists.values():
+            if artist.name and artist.nationality and artist.birth_date:
+                artists_with_complete_data += 1
+            if not artist.label_id:
+                unsigned_artists += 1
 
-        albums_with_complete_data = sum(1 for album in self.reasoner.albums.values()
-                                        if album.artist_ids and album.release_year > 0 and album.song_ids)
+        # Completeness scores
+        songs_with_complete_data = song_aggs.complete
+        albums_with_complete_data = album_aggs.complete
 
         quality_metrics['completeness_scores'] = {
             'songs_complete_percentage': (songs_with_complete_data / len(self.reasoner.songs)) * 100 if self.reasoner.songs else 0,
@@ -557,12 +816,8 @@ class MusicAnalytics:
         }
 
         # Relationship integrity
-        orphaned_songs = sum(
-            1 for song in self.reasoner.songs.values() if not song.artist_ids)
-        orphaned_albums = sum(
-            1 for album in self.reasoner.albums.values() if not album.artist_ids)
-        unsigned_artists = sum(
-            1 for artist in self.reasoner.artists.values() if not artist.label_id)
+        orphaned_songs = song_aggs.orphaned
+        orphaned_albums = album_aggs.orphaned
 
         total_entities = len(self.reasoner.songs) + len(self.reasoner.albums)
         orphaned_entities = orphaned_songs + orphaned_albums
@@ -586,46 +841,23 @@ class MusicAnalytics:
             'market_trends': []
         }
 
+        song_aggs = self._song_aggregates()
+
         # Collaboration opportunities - artists in similar genres who haven't collaborated
-        genre_artist_map = defaultdict(set)
-        for song in self.reasoner.songs.values():
-            for genre_id in song.genre_ids:
-                for artist_id in song.artist_ids:
-                    genre_artist_map[genre_id].add(artist_id)
-
-        collaboration_opportunities = []
-        for genre_id, artist_ids in genre_artist_map.items():
-            if len(artist_ids) >= 2:
-                artist_list = list(artist_ids)
-                for i in range(len(artist_list)):
-                    for j in range(i + 1, len(artist_list)):
-                        artist1_id, artist2_id = artist_list[i], artist_list[j]
-                        if (artist1_id in self.reasoner.artists and artist2_id in self.reasoner.artists and
-                                artist2_id not in self.reasoner.artists[artist1_id].collaboration_partners):
-                            collaboration_opportunities.append({
-                                'artist1': self.reasoner.artists[artist1_id].name,
-                                'artist2': self.reasoner.artists[artist2_id].name,
-                                'shared_genre': self.reasoner.genres[genre_id].genre_name if genre_id in self.reasoner.genres else genre_id,
-                                'potential_score': self.reasoner.artists[artist1_id].popularity_score + self.reasoner.artists[artist2_id].popularity_score
-                            })
-
-        # Sort by potential score and take top opportunities
-        collaboration_opportunities.sort(
-            key=lambda x: x['potential_score'], reverse=True)
-        insights['collaboration_opportunities'] = collaboration_opportunities[:5]
+        genre_artist_map = song_aggs.genre_artists
+
+        insights['collaboration_opportunities'] = self._top_collaboration_opportunities(
+            genre_artist_map, 5)
 
         # Emerging genres - genres with high growth in collaborations
-        genre_collaboration_count = Counter()
-        for song in self.reasoner.songs.values():
-            if song.is_collaborative:
-                for genre_id in song.genre_ids:
-                    genre_collaboration_count[genre_id] += 1
+        genre_collaboration_count = song_aggs.collab_genre_counts
 
         emerging_genres = []
+        genres = self.reasoner.genres
         for genre_id, collab_count in genre_collaboration_count.most_common(5):
-            if genre_id in self.reasoner.genres:
+            if genre_id in genres:
                 emerging_genres.append({
-                    'genre_name': self.reasoner.genres[genre_id].genre_name,
+                    'genre_name': genres[genre_id].genre_name,
                     'collaboration_count': collab_count,
                     'growth_indicator': 'high' if collab_count > 3 else 'moderate'
                 })
@@ -633,11 +865,12 @@ class MusicAnalytics:
         insights['emerging_genres'] = emerging_genres
 
         # Label performance insights
+        artists = self.reasoner.artists
         label_insights = []
         for label in self.reasoner.record_labels.values():
             if label.signed_artists:
-                signed_artist_scores = [self.reasoner.artists[aid].popularity_score
-                                        for aid in label.signed_artists if aid in self.reasoner.artists]
+                signed_artist_scores = [artists[aid].popularity_score
+                                        for aid in label.signed_artists if aid in artists]
                 avg_artist_popularity = sum(
                     signed_artist_scores) / len(signed_artist_scores) if signed_artist_scores else 0
 
@@ -649,50 +882,114 @@ class MusicAnalytics:
                     'recommendation': 'Focus on artist development' if avg_artist_popularity < 5 else 'Maintain current strategy'
                 })
 
-        label_insights.sort(
-            key=lambda x: x['average_artist_popularity'], reverse=True)
-        insights['label_performance_insights'] = label_insights[:5]
+        insights['label_performance_insights'] = heapq.nlargest(
+            5, label_insights, key=lambda x: x['average_artist_popularity'])
 
         # Artist development recommendations
-        development_recommendations = []
-        for artist in self.reasoner.artists.values():
-            if not artist.is_established and artist.popularity_score > 0:
-                potential_score = artist.popularity_score + \
-                    len(artist.collaboration_partners)
-                development_recommendations.append({
-                    'artist_name': artist.name,
-                    'current_stage': 'developing' if artist.album_count >= 1 else 'emerging',
-                    'recommendation': self._get_artist_recommendation(artist),
-                    'potential_score': potential_score
-                })
-
-        development_recommendations.sort(
-            key=lambda x: x['potential_score'], reverse=True)
-        insights['artist_development_recommendations'] = development_recommendations[:5]
+        def potential_score(artist) -> int:
+            return artist.popularity_score + len(artist.collaboration_partners)
+
+        developing_artists = heapq.nlargest(
+            5, (artist for artist in artists.values()
+                if not artist.is_established and artist.popularity_score > 0),
+            key=potential_score)
+        insights['artist_development_recommendations'] = [{
+            'artist_name': artist.name,
+            'current_stage': 'developing' if artist.album_count >= 1 else 'emerging',
+            'recommendation': self._get_artist_recommendation(artist),
+            'potential_score': potential_score(artist)
+        } for artist in developing_artists]
 
         return insights
 
+    def _top_collaboration_opportunities(self, genre_artist_map: Dict[str, Set[str]],
+                                         top_n: int) -> List[Dict[str, Any]]:
+        """
+        Best-scoring pairs of artists sharing a genre who have not collaborated yet.
+        Pairs are ranked by combined popularity; equal scores keep the order in which
+        the genres and their artists are enumerated. Each genre's artists are walked
+        by descending popularity, so pairs that can no longer reach the top are skipped.
+        """
+        artists = self.reasoner.artists
+        genres = self.reasoner.genres
+
+        # Min-heap of (score, negated enumeration order, artist1 id, artist2 id, genre id)
+        top_pairs = []
+
+        def can_enter(score: int, genre_index: int) -> bool:
+            if len(top_pairs) < top_n:
+                return True
+            min_score, min_order = top_pairs[0][0], top_pairs[0][1]
+            # A tie only wins over a pair enumerated later, i.e. within the same genre
+            return score > min_score or (score == min_score and -min_order[0] == genre_index)
+
+        for genre_index, (genre_id, artist_ids) in enumerate(genre_artist_map.items()):
+            # The enumeration position fixes artist order within a pair and breaks ties
+            ranked = sorted(((artists[aid].popularity_score, pos, aid)
+                             for pos, aid in enumerate(artist_ids) if aid in artists),
+                            key=lambda x: (-x[0], x[1]))
+
+            for a in range(len(ranked) - 1):
+                score_a, pos_a, id_a = ranked[a]
+                if not can_enter(score_a + ranked[a + 1][0], genre_index):
+                    break
+                for score_b, pos_b, id_b in ranked[a + 1:]:
+                    score = score_a + score_b
+                    if not can_enter(score, genre_index):
+                        break
+                    if pos_a < pos_b:
+                        order, artist1_id, artist2_id = (-genre_index, -pos_a, -pos_b), id_a, id_b
+                    else:
+                        order, artist1_id, artist2_id = (-genre_index, -pos_b, -pos_a), id_b, id_a
+                    if artist2_id in artists[artist1_id].collaboration_partners:
+                        continue
+
+                    entry = (score, order, artist1_id, artist2_id, genre_id)
+                    if len(top_pairs) < top_n:
+                        heapq.heappush(top_pairs, entry)
+                    elif (score, order) > (top_pairs[0][0], top_pairs[0][1]):
+                        heapq.heapreplace(top_pairs, entry)
+
+        return [{
+            'artist1': artists[artist1_id].name,
+            'artist2': artists[artist2_id].name,
+            'shared_genre': genres[genre_id].genre_name if genre_id in genres else genre_id,
+            'potential_score': score
+        } for score, _, artist1_id, artist2_id, genre_id in sorted(top_pairs, reverse=True)]
+
     def _get_artist_recommendation(self, artist) -> str:
         """Generate specific recommendation for an artist based on their profile."""
-        if artist.album_count == 0:
-            return "Release debut album to establish presence"
-        elif artist.album_count == 1 and not artist.collaboration_partners:
-            return "Explore collaborations to expand audience"
-        elif len(artist.collaboration_partners) > 0 and artist.award_count == 0:
-            return "Focus on award-worthy quality in next release"
-        elif artist.album_count >= 2 and artist.award_count == 0:
-            return "Target award submissions and industry recognition"
-        else:
-            return "Continue current trajectory toward establishment"
+        return _ARTIST_RECOMMENDATIONS[(min(artist.album_count, 2),
+                                        bool(artist.collaboration_partners),
+                                        artist.award_count > 0)]
 
-    def generate_json_report(self, output_path: str) -> None:
-        """Generate comprehensive JSON report with all analysis results."""
+    def generate_json_report(self, output_path: Union[str, os.PathLike],
+                             stats: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Generate comprehensive JSON report with all analysis results.
+        Pass stats to reuse statistics already generated for another report.
+        """
         logger.info(f"Generating JSON report at {output_path}")
 
         # Generate comprehensive statistics
-        stats = self.generate_comprehensive_statistics()
+        if stats is None:
+            stats = self.generate_comprehensive_statistics()
+
+        # Song dataclasses hold exactly the fields _serialize_song emits, in the
+        # same order, so orjson encodes them directly. The other entities carry
+        # extra relationship fields the report leaves out.
+        serialize_song = None if ORJSON_AVAILABLE else self._serialize_song
+
+        # Entities are produced one at a time, as (id, entity) pairs
+        entities = {
+            'songs': self._entity_items(self.reasoner.songs, serialize_song),
+            'artists': self._entity_items(self.reasoner.artists, self._serialize_artist),
+            'albums': self._entity_items(self.reasoner.albums, self._serialize_album),
+            'record_labels': self._entity_items(self.reasoner.record_labels, self._serialize_label),
+            'genres': self._entity_items(self.reasoner.genres, self._serialize_genre),
+            'awards': self._entity_items(self.reasoner.awards, self._serialize_award)
+        }
 
-        # Add entity data
         report = {
             'metadata': {
                 'report_type': 'Music Industry Ontology Analysis',
@@ -701,14 +998,7 @@ class MusicAnalytics:
                 'version': '1.0'
             },
             'statistics': stats,
-            'entities': {
-                'songs': {song.id: self._serialize_song(song) for song in self.reasoner.songs.values()},
-                'artists': {artist.id: self._serialize_artist(artist) for artist in self.reasoner.artists.values()},
-                'albums': {album.id: self._serialize_album(album) for album in self.reasoner.albums.values()},
-                'record_labels': {label.id: self._serialize_label(label) for label in self.reasoner.record_labels.values()},
-                'genres': {genre.id: self._serialize_genre(genre) for genre in self.reasoner.genres.values()},
-                'awards': {award.id: self._serialize_award(award) for award in self.reasoner.awards.values()}
-            },
+            'entities': entities,
             'reasoning_results': {
                 'collaborative_songs': list(self.reasoner.collaborative_songs),
                 'successful_labels': list(self.reasoner.successful_labels),
@@ -719,23 +1009,39 @@ class MusicAnalytics:
             }
         }
 
-        # Save JSON report
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, default=str, ensure_ascii=False)
+        # Save JSON report. Besides plain JSON values it holds int-keyed dicts,
+        # covered by OPT_NON_STR_KEYS, the entities' dates, which orjson
+        # writes in ISO format natively and json via str(), and the entities'
+        # id sets, which both encoders' default hooks turn into lists
+        if ORJSON_AVAILABLE:
+            # Written entity by entity, so the serialized entities never all
+            # exist at once; the output matches a single OPT_INDENT_2 dump
+            with open(output_path, 'wb') as f:
+                _write_json_object(f.write, report.items())
+        else:
+            report['entities'] = {kind: dict(items) for kind, items in entities.items()}
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, default=_json_default, ensure_ascii=False)
 
         logger.info(f"JSON report saved successfully to {output_path}")
 
+    @staticmethod
+    def _entity_items(store: Dict[str, Any], serialize=None) -> Iterator[Tuple[str, Any]]:
+        """Yield (id, entity) pairs for the report, serialized with serialize if given."""
+        for entity in store.values():
+            yield entity.id, serialize(entity) if serialize else entity
+
     def _serialize_song(self, song) -> Dict:
         """Serialize song entity for JSON export."""
         return {
             'id': song.id,
             'title': song.title,
             'duration': song.duration,
-            'release_date': song.release_date.isoformat() if song.release_date else None,
-            'artist_ids': list(song.artist_ids),
-            'album_ids': list(song.album_ids),
-            'genre_ids': list(song.genre_ids),
-            'award_ids': list(song.award_ids),
+            'release_date': song.release_date,
+            'artist_ids': song.artist_ids,
+            'album_ids': song.album_ids,
+            'genre_ids': song.genre_ids,
+            'award_ids': song.award_ids,
             'is_collaborative': song.is_collaborative,
             'collaboration_count': song.collaboration_count,
             'primary_genre': song.primary_genre
@@ -746,18 +1052,18 @@ class MusicAnalytics:
         return {
             'id': artist.id,
             'name': artist.name,
-            'birth_date': artist.birth_date.isoformat() if artist.birth_date else None,
+            'birth_date': artist.birth_date,
             'nationality': artist.nationality,
             'label_id': artist.label_id,
             'is_established': artist.is_established,
-            'collaboration_partners': list(artist.collaboration_partners),
-            'collaboration_strength': dict(artist.collaboration_strength),
-            'influenced_by': list(artist.influenced_by),
-            'influences': list(artist.influences),
+            'collaboration_partners': artist.collaboration_partners,
+            'collaboration_strength': artist.collaboration_strength,
+            'influenced_by': artist.influenced_by,
+            'influences': artist.influences,
             'popularity_score': artist.popularity_score,
             'award_count': artist.award_count,
             'album_count': artist.album_count,
-            'contemporary_artists': list(artist.contemporary_artists)
+            'contemporary_artists': artist.contemporary_artists
         }
 
     def _serialize_album(self, album) -> Dict:
@@ -766,14 +1072,14 @@ class MusicAnalytics:
             'id': album.id,
             'album_title': album.album_title,
             'release_year': album.release_year,
-            'artist_ids': list(album.artist_ids),
+            'artist_ids': album.artist_ids,
             'label_id': album.label_id,
-            'genre_ids': list(album.genre_ids),
-            'song_ids': list(album.song_ids),
-            'inherited_genres': list(album.inherited_genres),
+            'genre_ids': album.genre_ids,
+            'song_ids': album.song_ids,
+            'inherited_genres': album.inherited_genres,
             'total_duration': album.total_duration,
             'track_count': album.track_count,
-            'contributors': list(album.contributors)
+            'contributors': album.contributors
         }
 
     def _serialize_label(self, label) -> Dict:
@@ -783,9 +1089,9 @@ class MusicAnalytics:
             'label_name': label.label_name,
             'location': label.location,
             'is_successful': label.is_successful,
-            'signed_artists': list(label.signed_artists),
+            'signed_artists': label.signed_artists,
             'success_rating': label.success_rating,
-            'award_winning_artists': list(label.award_winning_artists)
+            'award_winning_artists': label.award_winning_artists
         }
 
     def _serialize_genre(self, genre) -> Dict:
@@ -794,7 +1100,7 @@ class MusicAnalytics:
             'id': genre.id,
             'genre_name': genre.genre_name,
             'description': genre.description,
-            'related_genres': list(genre.related_genres),
+            'related_genres': genre.related_genres,
             'artist_count': genre.artist_count,
             'song_count': genre.song_count,
             'album_count': genre.album_count
@@ -807,15 +1113,20 @@ class MusicAnalytics:
             'award_name': award.award_name,
             'year': award.year,
             'awarding_body': award.awarding_body,
-            'artist_ids': list(award.artist_ids),
-            'song_ids': list(award.song_ids)
+            'artist_ids': award.artist_ids,
+            'song_ids': award.song_ids
         }
 
-    def generate_markdown_report(self, output_path: str) -> None:
-        """Generate comprehensive markdown report with formatted analysis."""
+    def generate_markdown_report(self, output_path: Union[str, os.PathLike],
+                                 stats: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Generate comprehensive markdown report with formatted analysis.
+        Pass stats to reuse statistics already generated for another report.
+        """
         logger.info(f"Generating Markdown report at {output_path}")
 
-        stats = self.generate_comprehensive_statistics()
+        if stats is None:
+            stats = self.generate_comprehensive_statistics()
 
         markdown_content = self._build_markdown_report(stats)
 
@@ -828,157 +1139,150 @@ class MusicAnalytics:
         """Build formatted markdown report content."""
         md = []
 
+        overview = stats['overview']
+        entities = overview['total_entities']
+        reasoning = overview['reasoning_results']
+
         # Header
-        md.append("# Music Industry Ontology Analysis Report\n")
         # md.append(
         #     f"**Generated:** {self.analysis_timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
         md.append(
-            f"**Processing Time:** {stats['overview']['processing_info']['processing_time_seconds']:.2f} seconds\n")
-        md.append(
-            f"**Total Inferences:** {stats['overview']['reasoning_results']['total_inferences']}\n\n")
+            "# Music Industry Ontology Analysis Report\n"
+            f"**Processing Time:** {overview['processing_info']['processing_time_seconds']:.2f} seconds\n"
+            f"**Total Inferences:** {reasoning['total_inferences']}\n\n")
 
         # Executive Summary
-        md.append("## Executive Summary\n")
-        overview = stats['overview']
-        md.append(
-            f"This analysis covers **{overview['total_entities']['songs']} songs**, ")
-        md.append(f"**{overview['total_entities']['artists']} artists**, ")
-        md.append(f"**{overview['total_entities']['albums']} albums**, ")
         md.append(
-            f"**{overview['total_entities']['record_labels']} record labels**, ")
-        md.append(f"**{overview['total_entities']['genres']} genres**, and ")
-        md.append(f"**{overview['total_entities']['awards']} awards** ")
-        md.append("in the music industry dataset.\n\n")
-
-        md.append("### Key Findings\n")
-        md.append(
-            f"- **{overview['reasoning_results']['collaborative_songs']} collaborative songs** identified through reasoning\n")
-        md.append(
-            f"- **{overview['reasoning_results']['established_artists']} established artists** with multiple albums and awards\n")
-        md.append(
-            f"- **{overview['reasoning_results']['successful_labels']} successful record labels** with award-winning artists\n")
+            "## Executive Summary\n"
+            f"This analysis covers **{entities['songs']} songs**, "
+            f"**{entities['artists']} artists**, "
+            f"**{entities['albums']} albums**, "
+            f"**{entities['record_labels']} record labels**, "
+            f"**{entities['genres']} genres**, and "
+            f"**{entities['awards']} awards** "
+            "in the music industry dataset.\n\n")
 
         # Safely calculate and display collaboration network density
         collab_density = stats['collaboration_analysis'].get(
             'collaboration_network_density', 0.0)
         md.append(
+            "### Key Findings\n"
+            f"- **{reasoning['collaborative_songs']} collaborative songs** identified through reasoning\n"
+            f"- **{reasoning['established_artists']} established artists** with multiple albums and awards\n"
+            f"- **{reasoning['successful_labels']} successful record labels** with award-winning artists\n"
             f"- **{collab_density:.4f}** collaboration network density\n\n")
 
         # Collaboration Analysis
-        md.append("## Collaboration Analysis\n")
         collab_stats = stats['collaboration_analysis']
-        md.append(
-            f"The music industry shows **{collab_stats['total_collaborative_songs']} collaborative songs** ")
         avg_collabs = collab_stats.get(
             'average_collaborations_per_artist', 0.0)
         md.append(
+            "## Collaboration Analysis\n"
+            f"The music industry shows **{collab_stats['total_collaborative_songs']} collaborative songs** "
             f"with an average of **{avg_collabs:.1f} collaborations per artist**.\n\n")
 
         if collab_stats['most_collaborative_artists']:
-            md.append("### Most Collaborative Artists\n")
-            md.append("| Rank | Artist | Collaborations | Total Strength |\n")
-            md.append("|------|--------|----------------|----------------|\n")
-            for i, artist in enumerate(collab_stats['most_collaborative_artists'][:5], 1):
-                md.append(
-                    f"| {i} | {artist['artist_name']} | {artist['collaboration_count']} | {artist['total_collaboration_strength']} |\n")
-            md.append("\n")
+            rows = "".join(
+                f"| {i} | {artist['artist_name']} | {artist['collaboration_count']} | {artist['total_collaboration_strength']} |\n"
+                for i, artist in enumerate(collab_stats['most_collaborative_artists'][:5], 1))
+            md.append(
+                "### Most Collaborative Artists\n"
+                "| Rank | Artist | Collaborations | Total Strength |\n"
+                "|------|--------|----------------|----------------|\n"
+                f"{rows}\n")
 
         # Genre Analysis
-        md.append("## Genre Analysis\n")
         genre_stats = stats['genre_analysis']
         md.append(
-            f"Analysis reveals **{genre_stats['total_genres']} distinct genres** ")
-        md.append(
+            "## Genre Analysis\n"
+            f"Analysis reveals **{genre_stats['total_genres']} distinct genres** "
             f"with **{genre_stats['cross_genre_collaborations']} cross-genre collaborations**.\n\n")
 
         if genre_stats['genre_popularity']:
-            md.append("### Most Popular Genres\n")
-            md.append("| Rank | Genre | Popularity Score |\n")
-            md.append("|------|-------|------------------|\n")
-            for i, genre in enumerate(genre_stats['genre_popularity'][:5], 1):
-                md.append(
-                    f"| {i} | {genre['genre_name']} | {genre['popularity_score']:.1f} |\n")
-            md.append("\n")
+            rows = "".join(
+                f"| {i} | {genre['genre_name']} | {genre['popularity_score']:.1f} |\n"
+                for i, genre in enumerate(genre_stats['genre_popularity'][:5], 1))
+            md.append(
+                "### Most Popular Genres\n"
+                "| Rank | Genre | Popularity Score |\n"
+                "|------|-------|------------------|\n"
+                f"{rows}\n")
 
         # Artist Analysis
-        md.append("## Artist Analysis\n")
         artist_stats = stats['artist_analysis']
-        md.append(
-            f"The dataset includes **{artist_stats['total_artists']} artists** ")
         established_percentage = (
             artist_stats['established_artists'] / artist_stats['total_artists'] * 100) if artist_stats['total_artists'] > 0 else 0
         md.append(
+            "## Artist Analysis\n"
+            f"The dataset includes **{artist_stats['total_artists']} artists** "
             f"with **{artist_stats['established_artists']} ({established_percentage:.1f}%) established artists**.\n\n")
 
         # Career stage distribution
         stages = artist_stats['artist_career_stages']
-        md.append("### Artist Career Stage Distribution\n")
-        md.append("| Stage | Count | Percentage |\n")
-        md.append("|-------|-------|------------|\n")
         total_artists = sum(stages.values())
-        for stage, count in stages.items():
-            percentage = (count / total_artists *
-                          100) if total_artists > 0 else 0
-            md.append(f"| {stage.title()} | {count} | {percentage:.1f}% |\n")
-        md.append("\n")
+        rows = "".join(
+            f"| {stage.title()} | {count} | {(count / total_artists * 100) if total_artists > 0 else 0:.1f}% |\n"
+            for stage, count in stages.items())
+        md.append(
+            "### Artist Career Stage Distribution\n"
+            "| Stage | Count | Percentage |\n"
+            "|-------|-------|------------|\n"
+            f"{rows}\n")
 
         # Top artists by popularity
         if artist_stats['top_artists_by_popularity']:
-            md.append("### Top Artists by Popularity Score\n")
-            md.append(
-                "| Rank | Artist | Popularity | Awards | Collaborations | Albums | Status |\n")
+            rows = "".join(
+                f"| {i} | {artist['artist_name']} | {artist['popularity_score']} | "
+                f"{artist['award_count']} | {artist['collaboration_count']} | "
+                f"{artist['album_count']} | {'Established' if artist['is_established'] else 'Developing'} |\n"
+                for i, artist in enumerate(artist_stats['top_artists_by_popularity'][:10], 1))
             md.append(
-                "|------|--------|------------|--------|----------------|--------|---------|\n")
-            for i, artist in enumerate(artist_stats['top_artists_by_popularity'][:10], 1):
-                status = "Established" if artist['is_established'] else "Developing"
-                md.append(
-                    f"| {i} | {artist['artist_name']} | {artist['popularity_score']} | ")
-                md.append(
-                    f"{artist['award_count']} | {artist['collaboration_count']} | ")
-                md.append(f"{artist['album_count']} | {status} |\n")
-            md.append("\n")
+                "### Top Artists by Popularity Score\n"
+                "| Rank | Artist | Popularity | Awards | Collaborations | Albums | Status |\n"
+                "|------|--------|------------|--------|----------------|--------|---------|\n"
+                f"{rows}\n")
 
         # Album Analysis
-        md.append("## Album Analysis\n")
         album_stats = stats['album_analysis']
         avg_tracks = album_stats.get('average_tracks_per_album', 0.0)
         avg_duration = album_stats.get('average_album_duration_minutes', 0.0)
-        md.append(f"Analysis covers **{album_stats['total_albums']} albums** ")
-        md.append(f"with an average of **{avg_tracks:.1f} tracks per album** ")
-        md.append(f"and **{avg_duration:.1f} minutes average duration**.\n\n")
+        md.append(
+            "## Album Analysis\n"
+            f"Analysis covers **{album_stats['total_albums']} albums** "
+            f"with an average of **{avg_tracks:.1f} tracks per album** "
+            f"and **{avg_duration:.1f} minutes average duration**.\n\n")
 
         # Release timeline
         if album_stats['albums_by_decade']:
-            md.append("### Albums by Decade\n")
-            md.append("| Decade | Album Count |\n")
-            md.append("|--------|-------------|\n")
-            for decade, count in sorted(album_stats['albums_by_decade'].items()):
-                md.append(f"| {decade} | {count} |\n")
-            md.append("\n")
+            rows = "".join(
+                f"| {decade} | {count} |\n"
+                for decade, count in sorted(album_stats['albums_by_decade'].items()))
+            md.append(
+                "### Albums by Decade\n"
+                "| Decade | Album Count |\n"
+                "|--------|-------------|\n"
+                f"{rows}\n")
 
         # Label Analysis
-        md.append("## Record Label Analysis\n")
         label_stats = stats['label_analysis']
-        md.append(
-            f"The industry analysis covers **{label_stats['total_labels']} record labels** ")
         successful_percentage = (
             label_stats['successful_labels'] / label_stats['total_labels'] * 100) if label_stats['total_labels'] > 0 else 0
         md.append(
+            "## Record Label Analysis\n"
+            f"The industry analysis covers **{label_stats['total_labels']} record labels** "
             f"with **{label_stats['successful_labels']} ({successful_percentage:.1f}%) successful labels**.\n\n")
 
         if label_stats['top_labels_by_success_rating']:
-            md.append("### Top Record Labels by Success Rating\n")
-            md.append(
-                "| Rank | Label | Success Rating | Artists | Award Winners | Status |\n")
+            rows = "".join(
+                f"| {i} | {label['label_name']} | {label['success_rating']} | "
+                f"{label['signed_artists_count']} | {label['award_winning_artists_count']} | "
+                f"{'Successful' if label['is_successful'] else 'Developing'} |\n"
+                for i, label in enumerate(label_stats['top_labels_by_success_rating'][:8], 1))
             md.append(
-                "|------|-------|----------------|---------|---------------|--------|\n")
-            for i, label in enumerate(label_stats['top_labels_by_success_rating'][:8], 1):
-                status = "Successful" if label['is_successful'] else "Developing"
-                md.append(
-                    f"| {i} | {label['label_name']} | {label['success_rating']} | ")
-                md.append(
-                    f"{label['signed_artists_count']} | {label['award_winning_artists_count']} | {status} |\n")
-            md.append("\n")
+                "### Top Record Labels by Success Rating\n"
+                "| Rank | Label | Success Rating | Artists | Award Winners | Status |\n"
+                "|------|-------|----------------|---------|---------------|--------|\n"
+                f"{rows}\n")
 
         # Business Insights
         md.append("## Business Insights & Recommendations\n")
@@ -986,74 +1290,70 @@ class MusicAnalytics:
 
         # Collaboration opportunities
         if insights['collaboration_opportunities']:
-            md.append("### Top Collaboration Opportunities\n")
+            rows = "".join(
+                f"| {opp['artist1']} | {opp['artist2']} | {opp['shared_genre']} | {opp['potential_score']} |\n"
+                for opp in insights['collaboration_opportunities'])
             md.append(
-                "These artists share genres but haven't collaborated yet:\n\n")
-            md.append(
-                "| Artist 1 | Artist 2 | Shared Genre | Potential Score |\n")
-            md.append("|----------|----------|--------------|----------------|\n")
-            for opp in insights['collaboration_opportunities']:
-                md.append(
-                    f"| {opp['artist1']} | {opp['artist2']} | {opp['shared_genre']} | {opp['potential_score']} |\n")
-            md.append("\n")
+                "### Top Collaboration Opportunities\n"
+                "These artists share genres but haven't collaborated yet:\n\n"
+                "| Artist 1 | Artist 2 | Shared Genre | Potential Score |\n"
+                "|----------|----------|--------------|----------------|\n"
+                f"{rows}\n")
 
         # Emerging genres
         if insights['emerging_genres']:
-            md.append("### Emerging Genres\n")
-            md.append("Genres showing high collaboration activity:\n\n")
-            for genre in insights['emerging_genres']:
-                md.append(
-                    f"- **{genre['genre_name']}**: {genre['collaboration_count']} collaborations ({genre['growth_indicator']} growth)\n")
-            md.append("\n")
+            items = "".join(
+                f"- **{genre['genre_name']}**: {genre['collaboration_count']} collaborations ({genre['growth_indicator']} growth)\n"
+                for genre in insights['emerging_genres'])
+            md.append(
+                "### Emerging Genres\n"
+                "Genres showing high collaboration activity:\n\n"
+                f"{items}\n")
 
         # Label performance insights
         if insights['label_performance_insights']:
-            md.append("### Label Performance Insights\n")
-            for label in insights['label_performance_insights']:
-                md.append(
-                    f"- **{label['label_name']}** ({label['performance_rating']}): ")
-                md.append(
-                    f"{label['artist_count']} artists, avg popularity {label['average_artist_popularity']:.1f} - ")
-                md.append(f"*{label['recommendation']}*\n")
-            md.append("\n")
+            items = "".join(
+                f"- **{label['label_name']}** ({label['performance_rating']}): "
+                f"{label['artist_count']} artists, avg popularity {label['average_artist_popularity']:.1f} - "
+                f"*{label['recommendation']}*\n"
+                for label in insights['label_performance_insights'])
+            md.append(
+                "### Label Performance Insights\n"
+                f"{items}\n")
 
         # Data Quality Assessment
-        md.append("## Data Quality Assessment\n")
         quality = stats['quality_metrics']
         completeness = quality['completeness_scores']
         integrity = quality['relationship_integrity']
 
-        md.append("### Completeness Scores\n")
-        md.append("| Entity Type | Completeness Percentage |\n")
-        md.append("|-------------|------------------------|\n")
         md.append(
-            f"| Songs | {completeness['songs_complete_percentage']:.1f}% |\n")
-        md.append(
-            f"| Artists | {completeness['artists_complete_percentage']:.1f}% |\n")
-        md.append(
-            f"| Albums | {completeness['albums_complete_percentage']:.1f}% |\n")
-        md.append("\n")
+            "## Data Quality Assessment\n"
+            "### Completeness Scores\n"
+            "| Entity Type | Completeness Percentage |\n"
+            "|-------------|------------------------|\n"
+            f"| Songs | {completeness['songs_complete_percentage']:.1f}% |\n"
+            f"| Artists | {completeness['artists_complete_percentage']:.1f}% |\n"
+            f"| Albums | {completeness['albums_complete_percentage']:.1f}% |\n"
+            "\n")
 
-        md.append("### Relationship Integrity\n")
-        md.append(f"- **Orphaned Songs**: {integrity['orphaned_songs']}\n")
-        md.append(f"- **Orphaned Albums**: {integrity['orphaned_albums']}\n")
-        md.append(f"- **Unsigned Artists**: {integrity['unsigned_artists']}\n")
         md.append(
+            "### Relationship Integrity\n"
+            f"- **Orphaned Songs**: {integrity['orphaned_songs']}\n"
+            f"- **Orphaned Albums**: {integrity['orphaned_albums']}\n"
+            f"- **Unsigned Artists**: {integrity['unsigned_artists']}\n"
             f"- **Overall Relationship Completeness**: {integrity['relationship_completeness_score']:.1f}%\n\n")
 
         # Technical Details
-        md.append("## Technical Processing Details\n")
-        md.append(
-            f"- **Entities Loaded**: {overview['processing_info']['entities_loaded']}\n")
         md.append(
-            f"- **Processing Time**: {overview['processing_info']['processing_time_seconds']:.2f} seconds\n")
-        md.append(
-            f"- **Total Inferences Made**: {overview['reasoning_results']['total_inferences']}\n")
+            "## Technical Processing Details\n"
+            f"- **Entities Loaded**: {overview['processing_info']['entities_loaded']}\n"
+            f"- **Processing Time**: {overview['processing_info']['processing_time_seconds']:.2f} seconds\n"
+            f"- **Total Inferences Made**: {reasoning['total_inferences']}\n")
         # md.append(
         #     f"- **Report Generated**: {overview['processing_info']['analysis_timestamp']}\n\n")
 
-        md.append("---\n")
         md.append(
+            "---\n"
             "...")
 
         return "".join(md)
@@ -1080,7 +1380,8 @@ class MusicReasonerUsage:
 
         try:
             # Ensure output directory exists
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            output_root = Path(output_dir)
+            output_root.mkdir(parents=True, exist_ok=True)
 
             # Load CSV data
             logger.info("Loading CSV data...")
@@ -1095,14 +1396,13 @@ class MusicReasonerUsage:
 
             # Generate reports
             logger.info("Generating comprehensive reports...")
-            json_path = Path(output_dir) / "music_analysis_report.json"
-            markdown_path = Path(output_dir) / "music_analysis_report.md"
-
-            self.analytics.generate_json_report(str(json_path))
-            self.analytics.generate_markdown_report(str(markdown_path))
+            json_path = output_root / "music_analysis_report.json"
+            markdown_path = output_root / "music_analysis_report.md"
 
-            # Get summary statistics
+            # Both reports and the summary share one set of statistics
             summary_stats = self.analytics.generate_comprehensive_statistics()
+            self.analytics.generate_json_report(json_path, summary_stats)
+            self.analytics.generate_markdown_report(markdown_path, summary_stats)
 
             logger.info("Complete analysis finished successfully!")
             logger.info(f"Reports saved to: {output_dir}")